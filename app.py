@@ -5,28 +5,28 @@ UVMForge - UVM Testbench Generator
 import streamlit as st
 import streamlit.components.v1 as components
 import os
-import io
-import zipfile
 import json
 import re
 import time
 import hashlib
 from datetime import datetime
-import google.generativeai as genai
-from src.templates import PROTOCOL_TEMPLATES
+from pathlib import Path
+from string import Template
+from typing import TYPE_CHECKING
 from src.rtl_parser import parse_rtl
-from src.spec_import import SpecParser
 from src.rtl_aware_gen import RTLAwareGenerator
-from src.coverage_analyzer import CoverageAnalyzer
-from src.sva_generator import SVAGenerator
+from src.spec_import import UnifiedSpecParser, spec_to_dict
 from src.app_helpers import (
     generate_wavedrom, calculate_quality_score, predict_bugs,
     create_testbench_zip, validate_rtl_syntax, get_protocol_comparison,
     create_html_export, SVA_LIBRARY, parse_uvm_components,
     analyze_testbench_complexity, get_signal_explorer_data,
-    generate_enhancement_suggestions
+    generate_enhancement_suggestions, build_gen_context
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 st.set_page_config(
     page_title="UVMForge - UVM Generator",
     page_icon=None,
@@ -34,19 +34,22 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Initialize session state for new features
-if 'dark_mode' not in st.session_state:
-    st.session_state['dark_mode'] = False
-if 'generation_history' not in st.session_state:
-    st.session_state['generation_history'] = []
-if 'favorite_templates' not in st.session_state:
-    st.session_state['favorite_templates'] = []
-if 'generation_stats' not in st.session_state:
-    st.session_state['generation_stats'] = {'total': 0, 'protocols': {}, 'avg_time': 0}
+# Initialize session state for new features - once per session, a single check on later reruns
+if 'session_ready' not in st.session_state:
+    for key, default in (
+        ('dark_mode', False),
+        ('generation_history', []),
+        ('favorite_templates', []),
+        ('generation_stats', {'total': 0, 'protocols': {}, 'avg_time': 0}),
+    ):
+        st.session_state.setdefault(key, default)
+    st.session_state['session_ready'] = True
 
 # Theme colors based on dark mode
-def get_theme_colors():
-    if st.session_state.get('dark_mode', False):
+def get_theme_colors(dark_mode: bool = None):
+    if dark_mode is None:
+        dark_mode = st.session_state.get('dark_mode', False)
+    if dark_mode:
         return {
             'bg': '#0d1117',
             'card': '#161b22',
@@ -72,804 +75,16 @@ def get_theme_colors():
 
 theme = get_theme_colors()
 
-# Professional clean CSS with dynamic theming
-st.markdown(f"""
-<style>
-    /* Hide defaults */
-    #MainMenu, footer, header {{visibility: hidden;}}
-    .block-container {{padding: 1.5rem 3rem 5rem; max-width: 1200px;}}
-    
-    /* Theme-aware styling */
-    .stApp {{
-        background: {theme['bg']};
-    }}
-    
-    /* Navigation */
-    .nav {{
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        padding: 0.8rem 0;
-        border-bottom: 1px solid {theme['border']};
-        margin-bottom: 2rem;
-    }}
-    .logo {{
-        font-size: 1.3rem;
-        font-weight: 700;
-        color: {theme['text']};
-        letter-spacing: -0.3px;
-    }}
-    .logo span {{
-        color: {theme['primary']};
-    }}
-    .nav-links {{
-        display: flex;
-        gap: 1.5rem;
-        align-items: center;
-    }}
-    .nav-link {{
-        color: {theme['text_muted']};
-        text-decoration: none;
-        font-size: 0.9rem;
-        transition: color 0.2s;
-    }}
-    .nav-link:hover {{
-        color: {theme['primary']};
-    }}
-    
-    /* Theme toggle button */
-    .theme-toggle {{
-        background: {theme['card']};
-        border: 1px solid {theme['border']};
-        border-radius: 20px;
-        padding: 0.4rem 0.8rem;
-        font-size: 0.8rem;
-        cursor: pointer;
-        display: inline-flex;
-        align-items: center;
-        gap: 0.3rem;
-        color: {theme['text_muted']};
-        transition: all 0.2s;
-    }}
-    .theme-toggle:hover {{
-        border-color: {theme['primary']};
-        color: {theme['primary']};
-    }}
-    
-    /* Hero - compact */
-    .hero {{
-        text-align: center;
-        padding: 1.5rem 0 1rem;
-    }}
-    .hero h1 {{
-        font-size: 2rem;
-        font-weight: 700;
-        color: {theme['text']};
-        margin-bottom: 0.5rem;
-    }}
-    .hero p {{
-        color: {theme['text_muted']};
-        font-size: 1rem;
-        max-width: 500px;
-        margin: 0 auto;
-    }}
-    
-    /* How it works */
-    .steps {{
-        display: flex;
-        justify-content: center;
-        gap: 3rem;
-        margin: 1.5rem 0 2rem;
-        padding: 1rem 0;
-    }}
-    .step {{
-        text-align: center;
-        max-width: 180px;
-    }}
-    .step-num {{
-        width: 28px;
-        height: 28px;
-        background: {theme['primary']};
-        color: white;
-        border-radius: 50%;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 0.85rem;
-        font-weight: 600;
-        margin-bottom: 0.5rem;
-    }}
-    .step-title {{
-        font-weight: 600;
-        color: {theme['text']};
-        font-size: 0.9rem;
-        margin-bottom: 0.25rem;
-    }}
-    .step-desc {{
-        color: {theme['text_muted']};
-        font-size: 0.8rem;
-    }}
-    
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {{
-        background: {theme['card']};
-        border: 1px solid {theme['border']};
-        border-radius: 8px;
-        padding: 4px;
-        gap: 4px;
-    }}
-    .stTabs [data-baseweb="tab"] {{
-        background: transparent;
-        color: {theme['text_muted']};
-        padding: 0.6rem 1.2rem;
-        font-size: 0.9rem;
-        border-radius: 6px;
-        font-weight: 500;
-    }}
-    .stTabs [aria-selected="true"] {{
-        background: {theme['primary']} !important;
-        color: white !important;
-    }}
-    .stTabs [data-baseweb="tab"]:hover {{
-        background: {theme['bg']};
-    }}
-    
-    /* Cards */
-    .card {{
-        background: {theme['card']};
-        border: 1px solid {theme['border']};
-        border-radius: 8px;
-        padding: 1.25rem;
-    }}
-    .card-title {{
-        font-weight: 600;
-        color: {theme['text']};
-        font-size: 0.95rem;
-        margin-bottom: 1rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 1px solid {theme['border']};
-    }}
-    
-    /* Text area */
-    .stTextArea textarea {{
-        background: {theme['card']} !important;
-        border: 1px solid {theme['border']} !important;
-        border-radius: 8px !important;
-        color: {theme['text']} !important;
-        font-family: 'SF Mono', 'Monaco', monospace !important;
-        font-size: 0.85rem !important;
-    }}
-    .stTextArea textarea:focus {{
-        border-color: {theme['primary']} !important;
-        box-shadow: 0 0 0 3px rgba(9, 105, 218, 0.1) !important;
-    }}
-    
-    /* Buttons */
-    .stButton > button {{
-        background: {theme['primary']} !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 6px !important;
-        padding: 0.6rem 1.5rem !important;
-        font-weight: 600 !important;
-        font-size: 0.9rem !important;
-        transition: all 0.2s !important;
-    }}
-    .stButton > button:hover {{
-        filter: brightness(0.9) !important;
-        transform: translateY(-1px);
-    }}
-    
-    /* Secondary buttons */
-    div[data-testid="column"] .stButton > button {{
-        background: {theme['bg']} !important;
-        color: {theme['text']} !important;
-        border: 1px solid {theme['border']} !important;
-        padding: 0.4rem 0.8rem !important;
-        font-size: 0.8rem !important;
-        font-weight: 500 !important;
-    }}
-    div[data-testid="column"] .stButton > button:hover {{
-        background: {theme['card']} !important;
-        border-color: {theme['primary']} !important;
-    }}
-    
-    /* Download button */
-    .stDownloadButton > button {{
-        background: {theme['success']} !important;
-        color: white !important;
-        border: none !important;
-    }}
-    .stDownloadButton > button:hover {{
-        filter: brightness(0.9) !important;
-    }}
-    
-    /* Code blocks - ensure ALL code is visible with syntax highlighting */
-    pre {{
-        background: #1e1e2e !important;
-        border: 1px solid {theme['border']} !important;
-        border-radius: 8px !important;
-        color: #cdd6f4 !important;
-        padding: 1rem !important;
-    }}
-    pre code {{
-        color: #cdd6f4 !important;
-        background: transparent !important;
-    }}
-    code {{
-        color: #cdd6f4 !important;
-    }}
-    .stCodeBlock {{
-        background: #1e1e2e !important;
-    }}
-    .stCodeBlock pre {{
-        background: #1e1e2e !important;
-        color: #cdd6f4 !important;
-    }}
-    .stCodeBlock code {{
-        color: #cdd6f4 !important;
-    }}
-    [data-testid="stCode"] {{
-        background: #1e1e2e !important;
-    }}
-    [data-testid="stCode"] pre {{
-        color: #cdd6f4 !important;
-        background: #1e1e2e !important;
-    }}
-    [data-testid="stCode"] code {{
-        color: #cdd6f4 !important;
-    }}
-    /* Syntax highlighting colors - Catppuccin Mocha theme */
-    .hljs-keyword, .hljs-type {{ color: #cba6f7 !important; }}
-    .hljs-string {{ color: #a6e3a1 !important; }}
-    .hljs-number {{ color: #fab387 !important; }}
-    .hljs-comment {{ color: #6c7086 !important; }}
-    .hljs-function {{ color: #89b4fa !important; }}
-    .hljs-class {{ color: #f9e2af !important; }}
-    .hljs-variable {{ color: #f38ba8 !important; }}
-    .hljs-operator {{ color: #89dceb !important; }}
-    .token, .token span {{ color: #cdd6f4 !important; }}
-    /* Force all code text visible */
-    pre * {{ color: inherit !important; }}
-    code * {{ color: inherit !important; }}
-    
-    /* File uploader - fix visibility */
-    [data-testid="stFileUploader"] {{
-        background: {theme['card']} !important;
-        border: 2px dashed {theme['border']} !important;
-        border-radius: 8px !important;
-        padding: 1rem !important;
-    }}
-    [data-testid="stFileUploader"] label {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploader"] p, [data-testid="stFileUploader"] span {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploader"] small {{
-        color: {theme['text_muted']} !important;
-    }}
-    [data-testid="stFileUploader"] section {{
-        background: {theme['card']} !important;
-    }}
-    [data-testid="stFileUploader"] section > div {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploaderDropzone"] {{
-        background: {theme['card']} !important;
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploaderDropzone"] div {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploaderDropzone"] span {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploaderDropzoneInstructions"] {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploaderDropzoneInstructions"] div {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stFileUploaderDropzoneInstructions"] span {{
-        color: {theme['text']} !important;
-    }}
-    .uploadedFile {{
-        color: {theme['text']} !important;
-    }}
-    /* File uploader button - fix text visibility */
-    [data-testid="stFileUploaderDropzone"] button {{
-        background: {theme['primary']} !important;
-        color: white !important;
-        border: none !important;
-    }}
-    [data-testid="stFileUploaderDropzone"] button span {{
-        color: white !important;
-    }}
-    [data-testid="baseButton-secondary"] {{
-        color: white !important;
-        background: {theme['primary']} !important;
-    }}
-    [data-testid="baseButton-secondary"] p {{
-        color: white !important;
-    }}
-    /* Select dropdown - add visual indicator */
-    .stSelectbox [data-baseweb="select"] {{
-        background: {theme['card']} !important;
-        border: 1px solid {theme['border']} !important;
-    }}
-    .stSelectbox [data-baseweb="select"]:after {{
-        content: ' ▼';
-        color: {theme['text_muted']};
-    }}
-    .stSelectbox svg {{
-        fill: {theme['text']} !important;
-    }}
-    .stSelectbox [data-baseweb="select"] > div {{
-        color: {theme['text']} !important;
-    }}
-    
-    /* Metrics */
-    [data-testid="stMetricValue"] {{
-        color: {theme['primary']};
-        font-size: 1.5rem !important;
-    }}
-    [data-testid="stMetricLabel"] {{
-        color: {theme['text_muted']};
-    }}
-    
-    /* Selectbox */
-    .stSelectbox > div > div {{
-        background: {theme['card']} !important;
-        border: 1px solid {theme['border']} !important;
-        border-radius: 6px !important;
-    }}
-    .stSelectbox label, .stSlider label, .stTextInput label, .stTextArea label {{
-        color: {theme['text']} !important;
-        font-weight: 500 !important;
-    }}
-    
-    /* Slider */
-    .stSlider > div > div > div {{
-        background: {theme['primary']} !important;
-    }}
-    .stSlider [data-baseweb="slider"] > div {{
-        color: {theme['text']} !important;
-    }}
-    
-    /* Radio buttons - comprehensive fix */
-    .stRadio label {{
-        color: {theme['text']} !important;
-    }}
-    .stRadio > div {{
-        color: {theme['text']} !important;
-    }}
-    .stRadio [data-baseweb="radio"] {{
-        color: {theme['text']} !important;
-    }}
-    .stRadio [data-baseweb="radio"] label {{
-        color: {theme['text']} !important;
-    }}
-    .stRadio div[role="radiogroup"] label {{
-        color: {theme['text']} !important;
-    }}
-    .stRadio div[role="radiogroup"] > label > div:last-child {{
-        color: {theme['text']} !important;
-    }}
-    [data-baseweb="radio"] > div:last-child {{
-        color: {theme['text']} !important;
-    }}
-    
-    /* All labels and text */
-    label, .stMarkdown p, .stMarkdown strong {{
-        color: {theme['text']} !important;
-    }}
-    
-    /* Expander styling - ensure visible text */
-    .streamlit-expanderHeader {{
-        color: {theme['text']} !important;
-        background: {theme['card']} !important;
-    }}
-    .streamlit-expanderHeader p, .streamlit-expanderHeader span {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stExpander"] {{
-        border: 1px solid {theme['border']} !important;
-        border-radius: 8px !important;
-        background: {theme['card']} !important;
-    }}
-    [data-testid="stExpander"] summary {{
-        color: {theme['text']} !important;
-        background: {theme['card']} !important;
-        padding: 0.75rem !important;
-    }}
-    [data-testid="stExpander"] summary span, [data-testid="stExpander"] summary p {{
-        color: {theme['text']} !important;
-    }}
-    [data-testid="stExpander"] > div {{
-        background: {theme['card']} !important;
-    }}
-    details {{
-        background: {theme['card']} !important;
-    }}
-    details summary {{
-        color: {theme['text']} !important;
-        background: {theme['card']} !important;
-    }}
-    details[open] summary {{
-        border-bottom: 1px solid {theme['border']} !important;
-    }}
-    
-    /* List items inside expanders */
-    .stMarkdown ul li, .stMarkdown ol li {{
-        color: {theme['text']} !important;
-    }}
-    
-    /* All text elements */
-    p, span, div {{
-        color: inherit;
-    }}
-    .element-container p, .element-container span {{
-        color: {theme['text']};
-    }}
-    
-    /* Alerts */
-    .stSuccess {{
-        background: {theme['success']}20 !important;
-        border: 1px solid {theme['success']}80 !important;
-        color: {theme['success']} !important;
-        border-radius: 6px !important;
-    }}
-    .stWarning {{
-        background: {theme['warning']}20 !important;
-        border: 1px solid {theme['warning']}80 !important;
-        color: {theme['warning']} !important;
-        border-radius: 6px !important;
-    }}
-    .stInfo {{
-        background: {theme['primary']}20 !important;
-        border: 1px solid {theme['primary']}80 !important;
-        color: {theme['primary']} !important;
-        border-radius: 6px !important;
-    }}
-    .stError {{
-        background: {theme['error']}20 !important;
-        border: 1px solid {theme['error']}80 !important;
-        color: {theme['error']} !important;
-        border-radius: 6px !important;
-    }}
-    
-    /* Footer */
-    .footer {{
-        position: fixed;
-        bottom: 0;
-        left: 0;
-        right: 0;
-        padding: 0.8rem 3rem;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        font-size: 0.8rem;
-        background: {theme['card']};
-        border-top: 1px solid {theme['border']};
-    }}
-    .footer a {{
-        color: {theme['primary']};
-        text-decoration: none;
-    }}
-    .footer a:hover {{
-        text-decoration: underline;
-    }}
-    
-    /* Placeholder */
-    .placeholder {{
-        background: {theme['bg']};
-        border: 1px dashed {theme['border']};
-        border-radius: 8px;
-        padding: 2rem;
-        text-align: center;
-        color: {theme['text_muted']};
-    }}
-    
-    /* Analysis badge */
-    .badge {{
-        display: inline-block;
-        background: {theme['primary']}20;
-        color: {theme['primary']};
-        padding: 0.2rem 0.6rem;
-        border-radius: 12px;
-        font-size: 0.75rem;
-        font-weight: 500;
-        margin-left: 0.5rem;
-    }}
-    .badge-success {{
-        background: {theme['success']}20;
-        color: {theme['success']};
-    }}
-    
-    /* Features bar */
-    .features-bar {{
-        display: flex;
-        justify-content: center;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-        margin-bottom: 1.5rem;
-        padding: 0.75rem;
-        background: {theme['card']};
-        border: 1px solid {theme['border']};
-        border-radius: 8px;
-    }}
-    .feature-item {{
-        background: {theme['bg']};
-        color: {theme['text_muted']};
-        padding: 0.3rem 0.7rem;
-        border-radius: 4px;
-        font-size: 0.75rem;
-        font-weight: 500;
-    }}
-    
-    /* Waveform diagram styling */
-    .waveform-container {{
-        background: #1e1e1e;
-        color: #00ff00;
-        font-family: 'SF Mono', 'Monaco', 'Consolas', monospace;
-        font-size: 0.7rem;
-        line-height: 1.2;
-        padding: 1rem;
-        border-radius: 8px;
-        overflow-x: auto;
-        white-space: pre;
-        border: 1px solid #333;
-    }}
-    .waveform-title {{
-        color: #00ff00;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }}
-    
-    /* Constraint code styling */
-    .constraint-box {{
-        background: {theme['bg']};
-        border: 1px solid {theme['border']};
-        border-radius: 6px;
-        padding: 0.75rem;
-        margin-bottom: 0.5rem;
-    }}
-    .constraint-title {{
-        font-weight: 600;
-        color: {theme['text']};
-        font-size: 0.85rem;
-        margin-bottom: 0.25rem;
-    }}
-    .constraint-desc {{
-        color: {theme['text_muted']};
-        font-size: 0.75rem;
-        margin-bottom: 0.5rem;
-    }}
-    
-    /* Mobile responsiveness */
-    @media (max-width: 768px) {{
-        .block-container {{
-            padding: 1rem !important;
-        }}
-        .steps {{
-            flex-direction: column;
-            gap: 1rem;
-        }}
-        .hero h1 {{
-            font-size: 1.5rem;
-        }}
-        .footer {{
-            padding: 0.8rem 1rem;
-            font-size: 0.75rem;
-        }}
-    }}
-    
-    /* Expander */
-    .streamlit-expanderHeader {{
-        background: {theme['bg']} !important;
-        border-radius: 6px !important;
-        font-weight: 500;
-    }}
-    
-    /* Quality Score Gauge */
-    .quality-gauge {{
-        text-align: center;
-        padding: 1rem;
-    }}
-    .score-circle {{
-        width: 80px;
-        height: 80px;
-        border-radius: 50%;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: white;
-        margin-bottom: 0.5rem;
-    }}
-    .score-high {{ background: linear-gradient(135deg, {theme['success']}, #1a7f37); }}
-    .score-medium {{ background: linear-gradient(135deg, {theme['warning']}, #9a6700); }}
-    .score-low {{ background: linear-gradient(135deg, {theme['error']}, #a40e26); }}
-    
-    /* Bug prediction card */
-    .bug-card {{
-        background: {theme['warning']}20;
-        border: 1px solid {theme['warning']}80;
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        margin-bottom: 0.5rem;
-    }}
-    .bug-card-high {{
-        background: {theme['error']}20;
-        border-color: {theme['error']}80;
-    }}
-    .bug-title {{
-        font-weight: 600;
-        color: {theme['warning']};
-        font-size: 0.85rem;
-    }}
-    .bug-card-high .bug-title {{
-        color: {theme['error']};
-    }}
-    .bug-desc {{
-        color: {theme['text_muted']};
-        font-size: 0.8rem;
-        margin-top: 0.25rem;
-    }}
-    
-    /* Stats grid */
-    .stats-grid {{
-        display: grid;
-        grid-template-columns: repeat(4, 1fr);
-        gap: 0.75rem;
-        margin-bottom: 1rem;
-    }}
-    .stat-box {{
-        background: {theme['card']};
-        border: 1px solid {theme['border']};
-        border-radius: 8px;
-        padding: 0.75rem;
-        text-align: center;
-    }}
-    .stat-value {{
-        font-size: 1.25rem;
-        font-weight: 700;
-        color: {theme['primary']};
-    }}
-    .stat-label {{
-        font-size: 0.7rem;
-        color: {theme['text_muted']};
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }}
-    
-    /* Copy button */
-    .copy-btn {{
-        position: relative;
-        display: inline-flex;
-        align-items: center;
-        gap: 0.3rem;
-        background: {theme['bg']};
-        border: 1px solid {theme['border']};
-        border-radius: 4px;
-        padding: 0.3rem 0.6rem;
-        font-size: 0.75rem;
-        cursor: pointer;
-        color: {theme['text_muted']};
-        transition: all 0.2s;
-    }}
-    .copy-btn:hover {{
-        background: {theme['card']};
-        color: {theme['primary']};
-        border-color: {theme['primary']};
-    }}
-    
-    /* History item */
-    .history-item {{
-        background: {theme['card']};
-        border: 1px solid {theme['border']};
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        margin-bottom: 0.5rem;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        transition: all 0.2s;
-    }}
-    .history-item:hover {{
-        border-color: {theme['primary']};
-        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-    }}
-    .history-name {{
-        font-weight: 600;
-        color: {theme['text']};
-        font-size: 0.9rem;
-    }}
-    .history-meta {{
-        color: {theme['text_muted']};
-        font-size: 0.75rem;
-        margin-top: 0.2rem;
-    }}
-    .history-time {{
-        color: {theme['text_muted']};
-        font-size: 0.75rem;
-    }}
-    
-    /* Protocol comparison table */
-    .proto-table {{
-        width: 100%;
-        border-collapse: collapse;
-        font-size: 0.85rem;
-    }}
-    .proto-table th, .proto-table td {{
-        padding: 0.6rem;
-        text-align: left;
-        border-bottom: 1px solid {theme['border']};
-    }}
-    .proto-table th {{
-        background: {theme['bg']};
-        font-weight: 600;
-        color: {theme['text']};
-    }}
-    .proto-table td {{
-        color: {theme['text_muted']};
-    }}
-    .proto-check {{ color: {theme['success']}; }}
-    .proto-x {{ color: {theme['error']}; }}
-    
-    /* Keyboard shortcuts */
-    .kbd {{
-        display: inline-block;
-        background: {theme['bg']};
-        border: 1px solid {theme['border']};
-        border-radius: 4px;
-        padding: 0.1rem 0.4rem;
-        font-size: 0.75rem;
-        font-family: monospace;
-        color: {theme['text_muted']};
-    }}
-    
-    /* Syntax validation indicator */
-    .syntax-valid {{
-        color: {theme['success']};
-        font-size: 0.8rem;
-        display: inline-flex;
-        align-items: center;
-        gap: 0.3rem;
-    }}
-    .syntax-invalid {{
-        color: {theme['error']};
-        font-size: 0.8rem;
-        display: inline-flex;
-        align-items: center;
-        gap: 0.3rem;
-    }}
-    
-    /* Performance metrics bar */
-    .perf-bar {{
-        display: flex;
-        gap: 1rem;
-        padding: 0.5rem 1rem;
-        background: {theme['card']};
-        border: 1px solid {theme['border']};
-        border-radius: 6px;
-        margin-top: 1rem;
-        font-size: 0.8rem;
-    }}
-    .perf-item {{
-        display: flex;
-        align-items: center;
-        gap: 0.3rem;
-        color: {theme['text_muted']};
-    }}
-    .perf-value {{
-        font-weight: 600;
-        color: {theme['primary']};
-    }}
-</style>
-""", unsafe_allow_html=True)
+STYLE_PATH = Path(__file__).parent / "static" / "style.css"
+
+@st.cache_resource(show_spinner=False)
+def get_theme_css(dark_mode: bool) -> str:
+    """Read static/style.css once per theme and return it as a filled-in <style> tag"""
+    colors = get_theme_colors(dark_mode)
+    return f"<style>\n{Template(STYLE_PATH.read_text()).substitute(colors)}</style>"
+
+# Professional clean CSS with dynamic theming (static/style.css, loaded once per theme)
+st.markdown(get_theme_css(st.session_state.get('dark_mode', False)), unsafe_allow_html=True)
 
 # ============== LOCAL HELPER FUNCTIONS (not in app_helpers) ==============
 
@@ -898,6 +113,125 @@ def add_to_history(name: str, protocol: str, code: str, generation_time: float):
     stats['avg_time'] = total_time / stats['total']
     st.session_state['generation_stats'] = stats
 
+@st.cache_data(show_spinner=False)
+def build_register_df(reg_columns: tuple) -> "pd.DataFrame":
+    """Build (and cache) the register map table from ((column, values), ...) pairs"""
+    # Imported on first use so reruns that never show a register map skip pandas
+    import pandas as pd
+    return pd.DataFrame({name: list(values) for name, values in reg_columns})
+
+@st.cache_data(show_spinner=False, persist="disk", max_entries=64)
+def parse_register_spec(content: str, source_file: str) -> list:
+    """Parse an IP-XACT/SystemRDL spec into register dicts (persisted on disk, so restarts reuse it)"""
+    spec_dict = spec_to_dict(UnifiedSpecParser().parse(content, source_file))
+    return [
+        {
+            'name': reg['name'],
+            'address': reg['address_hex'],
+            'width': reg['width'],
+            'access': reg['access'].upper(),
+            'reset_value': f"0x{reg['reset_value']:X}",
+            'description': reg['description']
+        }
+        for block in spec_dict['register_blocks']
+        for reg in block['registers']
+    ]
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def parse_coverage_text(content: str) -> dict:
+    """Regex-parse a coverage report into total/coverpoints/suggestions (cached on the report text)"""
+    # Parse overall/total coverage - multiple patterns
+    total = 0.0
+    patterns = [
+        r'[Oo]verall\s*[Cc]overage[:\s]+([\d.]+)\s*%',
+        r'[Tt]otal\s*[Cc]overage[:\s]+([\d.]+)\s*%',
+        r'[Oo]verall[:\s]+([\d.]+)\s*%',
+        r'[Tt]otal[:\s]+([\d.]+)\s*%',
+        r'[Cc]overage[:\s]+([\d.]+)\s*%',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, content)
+        if match:
+            total = float(match.group(1))
+            break
+    
+    # Parse coverpoint percentages
+    coverpoints = [(name, float(pct)) for name, pct in re.findall(r'([\w_]+)(?:_cp)?[:\s-]+\s*([\d.]+)\s*%', content)]
+    
+    # Parse uncovered bins
+    uncovered = re.findall(r'bin\s+([\w_]+)[^\n]*(?:0\s*hits|UNCOVERED)', content, re.IGNORECASE)
+    suggestions = [f"Add test to hit bin '{u}'" for u in uncovered[:10]]
+    
+    # Also look for general uncovered items
+    uncovered2 = re.findall(r'([\w_]+)[:\s]*0\s*hits', content)
+    for u in uncovered2[:5]:
+        if u not in uncovered:
+            suggestions.append(f"Create sequence to cover '{u}'")
+    
+    return {
+        'total_coverage': total,
+        'coverpoints': coverpoints,
+        'suggestions': suggestions
+    }
+
+def analyze_coverage_text(content: str, goal: float = 90.0) -> dict:
+    """Coverage total/gaps/suggestions; only the cheap gap pass reruns when just the goal changes"""
+    parsed = parse_coverage_text(content)
+    gaps = [
+        f"{name}: {pct:.0f}% (needs {goal-pct:.0f}% more)"
+        for name, pct in parsed['coverpoints']
+        if pct < goal
+    ]
+    return {
+        'total_coverage': parsed['total_coverage'],
+        'gaps': gaps,
+        'suggestions': parsed['suggestions']
+    }
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def generate_sva_text(rtl_code: str) -> tuple:
+    """Parse RTL and render its SVA bind module as (module_name, sv_text, assertion_count); cached on the RTL text"""
+    # Imported on first use so page loads that never visit the SVA tab skip it
+    from src.sva_generator import SVAGenerator
+    parsed = parse_rtl(rtl_code)
+    # SVAGenerator expects ParsedRTL, SimpleParsedRTL has _parsed attribute
+    sva_module = SVAGenerator(parsed._parsed).generate_all()
+    return parsed.module_name, sva_module.to_sv(), sva_module.assertion_count
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_testbench_zip(module_name: str, generated_code: str) -> bytes:
+    """Build (and cache, up to 32 archives) the testbench ZIP so reruns reuse the same bytes"""
+    return create_testbench_zip(module_name, generated_code, None)
+
+def get_rtl_generator() -> RTLAwareGenerator:
+    """Reuse one RTLAwareGenerator per session (its RTLParser keeps per-parse state, so it is not shared across sessions)"""
+    if 'rtl_generator' not in st.session_state:
+        st.session_state['rtl_generator'] = RTLAwareGenerator()
+    return st.session_state['rtl_generator']
+
+def get_upload_text(uploaded_file) -> str:
+    """Decode an uploaded file once per upload (getvalue() is idempotent, unlike read())"""
+    if uploaded_file is None:
+        return ""
+    # One (file_id, text) entry, replaced by the next upload, so old uploads aren't kept around
+    file_id, text = st.session_state.get('_upload', (None, ""))
+    if file_id != uploaded_file.file_id:
+        text = uploaded_file.getvalue().decode('utf-8')
+        st.session_state['_upload'] = (uploaded_file.file_id, text)
+    return text
+
+def keep_draft(widget_key: str, state_key: str) -> None:
+    """on_change callback: copy a text area into the plain session key it reads as value=, so drafts survive a tab switch"""
+    st.session_state[state_key] = st.session_state[widget_key]
+
+def render_signal_table(signals: list) -> None:
+    """Show port signals as one column-built table instead of a markdown line per port"""
+    st.dataframe({
+        "Signal": [sig['name'] for sig in signals],
+        "Kind": ["🔧 control" if sig['category'] == 'control' else "📊 data" for sig in signals],
+        "Width": [sig['width'] for sig in signals],
+    }, use_container_width=True, hide_index=True)
+
 def render_copy_button(text: str, key: str) -> None:
     """Render a copy-to-clipboard button using JavaScript"""
     escaped_text = text.replace('`', '\\`').replace('$', '\\$')
@@ -1047,16 +381,13 @@ if st.session_state.get('show_history', False):
         else:
             st.info("No generation history yet. Generate a testbench to see it here!")
 
-# Hero
-st.markdown("""
+# Hero, how-it-works steps and feature bar: static HTML, sent as one message
+HERO_HTML = """
 <div class="hero">
     <h1>UVM Testbench Generator</h1>
     <p>Generate production-ready UVM verification components from RTL code in seconds</p>
 </div>
-""", unsafe_allow_html=True)
 
-# How it works - more compact
-st.markdown("""
 <div class="steps">
     <div class="step">
         <div class="step-num">1</div>
@@ -1074,10 +405,7 @@ st.markdown("""
         <div class="step-desc">Complete UVM testbench</div>
     </div>
 </div>
-""", unsafe_allow_html=True)
 
-# What you get
-st.markdown("""
 <div class="features-bar">
     <span class="feature-item">Interface</span>
     <span class="feature-item">Driver</span>
@@ -1087,14 +415,23 @@ st.markdown("""
     <span class="feature-item">Sequences</span>
     <span class="feature-item">Tests</span>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(HERO_HTML, unsafe_allow_html=True)
 
 # LLM setup
+@st.cache_resource(show_spinner=False)
+def _cached_llm(key_fingerprint: str, _api_key: str):
+    """Build the Gemini model once per API key (keyed on a SHA1 of the key, not the key itself)"""
+    # Imported here so the SDK only loads when an LLM client is actually built
+    import google.generativeai as genai
+    genai.configure(api_key=_api_key)
+    return genai.GenerativeModel('gemini-1.5-flash')
+
 def get_llm():
     api_key = os.environ.get("GEMINI_API_KEY", "")
     if api_key:
-        genai.configure(api_key=api_key)
-        return genai.GenerativeModel('gemini-1.5-flash')
+        return _cached_llm(hashlib.sha1(api_key.encode()).hexdigest(), api_key)
     return None
 
 def generate_with_llm(prompt: str) -> str:
@@ -1340,11 +677,23 @@ SAMPLE_AXI = '''module axi_lite_slave #(
     reg [ADDR_WIDTH-1:0] w_addr;
 endmodule'''
 
-# Tabs
-tabs = st.tabs(["RTL to Testbench", "Protocol Templates", "Coverage Analysis", "SVA Assertions", "Register Map"])
+# Quality score breakdown grid (filled from calculate_quality_score()['breakdown'])
+QUALITY_STATS_TMPL = '''<div class="stats-grid">
+    <div class="stat-box"><div class="stat-value">{completeness}/40</div><div class="stat-label">Completeness</div></div>
+    <div class="stat-box"><div class="stat-value">{protocol}/20</div><div class="stat-label">Protocol</div></div>
+    <div class="stat-box"><div class="stat-value">{coverage}/20</div><div class="stat-label">Coverage</div></div>
+    <div class="stat-box"><div class="stat-value">{quality}/20</div><div class="stat-label">UVM Best Practices</div></div>
+</div>'''
+
+# Tabs - rendered as a radio so only the selected tab's body executes on each rerun
+# (st.tabs runs every tab body regardless of which one is visible)
+TAB_NAMES = ["RTL to Testbench", "Protocol Templates", "Coverage Analysis", "SVA Assertions", "Register Map"]
+active_tab = st.radio("View", TAB_NAMES, horizontal=True, label_visibility="collapsed", key="active_tab")
 
 # Tab 1: RTL to Testbench
-with tabs[0]:
+@st.fragment
+def render_rtl_tab():
+    """Tab 1: paste/upload RTL and generate a testbench"""
     col1, col2 = st.columns([1, 1], gap="medium")
     
     with col1:
@@ -1361,7 +710,7 @@ with tabs[0]:
             )
         
         if uploaded_file is not None:
-            file_content = uploaded_file.read().decode('utf-8')
+            file_content = get_upload_text(uploaded_file)
             st.session_state['rtl_input'] = file_content
             st.success(f"✅ Loaded: {uploaded_file.name}")
         
@@ -1379,7 +728,10 @@ with tabs[0]:
             value=st.session_state.get('rtl_input', ''),
             height=350,
             placeholder="// Paste your Verilog/SystemVerilog RTL here or upload a file above\n// We'll auto-detect the protocol and generate a matching UVM testbench",
-            label_visibility="collapsed"
+            label_visibility="collapsed",
+            key="rtl_text",
+            on_change=keep_draft,
+            args=("rtl_text", "rtl_input")
         )
         
         # Real-time syntax validation
@@ -1403,9 +755,8 @@ with tabs[0]:
                         st.error(f"⚠️ {err}")
                     st.stop()
                 
-                if validation['warnings']:
-                    for warn in validation['warnings']:
-                        st.warning(f"⚡ {warn}")
+                # Shown by the output column, so the rerun after a successful generation keeps them
+                st.session_state['gen_warnings'] = validation['warnings']
                 
                 with st.spinner("Analyzing RTL and generating testbench..."):
                     try:
@@ -1413,9 +764,9 @@ with tabs[0]:
                         parsed = parse_rtl(rtl_code)
                         st.session_state['parsed'] = parsed
                         
-                        # Generate testbench using RTLAwareGenerator
-                        generator = RTLAwareGenerator()
-                        generated_files = generator.generate_from_rtl(rtl_code)
+                        # Generate testbench using RTLAwareGenerator (reusing the parse above)
+                        generator = get_rtl_generator()
+                        generated_files = generator.generate_from_parsed(parsed._parsed)
                         
                         # Combine all generated files into one result
                         result_parts = []
@@ -1437,36 +788,54 @@ with tabs[0]:
                     except Exception as e:
                         st.session_state['gen_error'] = str(e)
                         st.session_state['gen_success'] = False
+                
+                # History panel and footer stats live outside this fragment; refresh them once
+                if st.session_state.get('gen_success'):
+                    st.rerun()
             else:
                 st.warning("Please paste your RTL code first")
     
     with col2:
         st.markdown('<div class="card-title">Generated Output</div>', unsafe_allow_html=True)
         
-        if st.session_state.get('gen_success') and st.session_state.get('parsed'):
-            parsed = st.session_state['parsed']
-            
-            # Analysis summary with protocol detection
-            protocol_info = ""
-            if hasattr(parsed, 'complexity') and parsed.complexity:
-                protocol = parsed.complexity.detected_protocol
-                confidence = parsed.complexity.protocol_confidence
-                if protocol != "generic":
-                    protocol_info = f" - Detected **{protocol.upper()}** ({int(confidence*100)}% confidence)"
-            
-            st.success(f"Analyzed **{parsed.module_name}**{protocol_info}")
+        # Bind session values once; the output column only reads them
+        ss = st.session_state
+        tb_result = ss.get('tb_result')
+        gen_error = ss.get('gen_error')
+        
+        for warn in ss.get('gen_warnings', ()):
+            st.warning(f"⚡ {warn}")
+        
+        if ss.get('gen_success') and ss.get('parsed'):
+            parsed = ss['parsed']
             
-            # Metrics row - enhanced
-            c1, c2, c3, c4 = st.columns(4)
-            c1.metric("Inputs", len(parsed.inputs))
-            c2.metric("Outputs", len(parsed.outputs))
+            # Analysis summary - built once per parse, then re-emitted from the cached strings
+            if ss.get('summary_src') is not parsed:
+                protocol_info = ""
+                if hasattr(parsed, 'complexity') and parsed.complexity:
+                    protocol = parsed.complexity.detected_protocol
+                    confidence = parsed.complexity.protocol_confidence
+                    if protocol != "generic":
+                        protocol_info = f" - Detected **{protocol.upper()}** ({int(confidence*100)}% confidence)"
+                
+                # Metrics row - one HTML block instead of 4 columns + 4 st.metric
+                metric_items = [("Inputs", len(parsed.inputs)), ("Outputs", len(parsed.outputs))]
+                if hasattr(parsed, 'complexity') and parsed.complexity:
+                    metric_items.append(("Complexity", parsed.complexity.complexity_score.title()))
+                    metric_items.append(("Est. Coverage Pts", parsed.complexity.estimated_coverage_points))
+                else:
+                    metric_items.append(("Clocks", len(parsed.clocks) if parsed.clocks else 0))
+                    metric_items.append(("FSM", "Yes" if parsed.fsm else "No"))
+                
+                ss['summary_src'] = parsed
+                ss['summary_title'] = f"Analyzed **{parsed.module_name}**{protocol_info}"
+                ss['summary_html'] = '<div class="stats-grid">' + ''.join(
+                    f'<div class="stat-box"><div class="stat-value">{value}</div><div class="stat-label">{label}</div></div>'
+                    for label, value in metric_items
+                ) + '</div>'
             
-            if hasattr(parsed, 'complexity') and parsed.complexity:
-                c3.metric("Complexity", parsed.complexity.complexity_score.title())
-                c4.metric("Est. Coverage Pts", parsed.complexity.estimated_coverage_points)
-            else:
-                c3.metric("Clocks", len(parsed.clocks) if parsed.clocks else 0)
-                c4.metric("FSM", "Yes" if parsed.fsm else "No")
+            st.success(ss['summary_title'])
+            st.markdown(ss['summary_html'], unsafe_allow_html=True)
             
             # Show detected info - enhanced
             with st.expander("View Analysis Details"):
@@ -1478,8 +847,10 @@ with tabs[0]:
                     states = parsed.fsm.get('states', [])
                     if states:
                         st.write(f"**FSM States:** {', '.join(states)}")
-                st.write(f"**Input signals:** `{', '.join(parsed.inputs[:5])}{'...' if len(parsed.inputs) > 5 else ''}`")
-                st.write(f"**Output signals:** `{', '.join(parsed.outputs[:5])}{'...' if len(parsed.outputs) > 5 else ''}`")
+                in_preview = ', '.join(parsed.inputs[:5]) + ('...' if len(parsed.inputs) > 5 else '')
+                out_preview = ', '.join(parsed.outputs[:5]) + ('...' if len(parsed.outputs) > 5 else '')
+                st.write(f"**Input signals:** `{in_preview}`")
+                st.write(f"**Output signals:** `{out_preview}`")
                 
                 # Show complexity details
                 if hasattr(parsed, 'complexity') and parsed.complexity:
@@ -1500,71 +871,66 @@ with tabs[0]:
                 if sig_filter == "All" or sig_filter == "Inputs":
                     if sig_data['inputs']:
                         st.markdown("**📥 Inputs**")
-                        for sig in sig_data['inputs'][:10]:
-                            cat_badge = "🔧" if sig['category'] == 'control' else "📊"
-                            st.markdown(f"- `{sig['name']}` {cat_badge} ({sig['width']} bit{'s' if sig['width'] > 1 else ''})")
+                        render_signal_table(sig_data['inputs'][:10])
                 
                 if sig_filter == "All" or sig_filter == "Outputs":
                     if sig_data['outputs']:
                         st.markdown("**📤 Outputs**")
-                        for sig in sig_data['outputs'][:10]:
-                            cat_badge = "🔧" if sig['category'] == 'control' else "📊"
-                            st.markdown(f"- `{sig['name']}` {cat_badge} ({sig['width']} bit{'s' if sig['width'] > 1 else ''})")
+                        render_signal_table(sig_data['outputs'][:10])
                 
                 if sig_filter == "All" or sig_filter == "Clocks":
                     if sig_data['clocks']:
-                        st.markdown("**⏰ Clocks**")
-                        for sig in sig_data['clocks']:
-                            st.markdown(f"- `{sig['name']}`")
+                        st.markdown("**⏰ Clocks**\n" + "\n".join(f"- `{sig['name']}`" for sig in sig_data['clocks']))
                 
                 if sig_filter == "All" or sig_filter == "Resets":
                     if sig_data['resets']:
-                        st.markdown("**🔄 Resets**")
-                        for sig in sig_data['resets']:
-                            active = "active-low" if sig.get('active_low') else "active-high"
-                            st.markdown(f"- `{sig['name']}` ({active})")
+                        st.markdown("**🔄 Resets**\n" + "\n".join(
+                            f"- `{sig['name']}` ({'active-low' if sig.get('active_low') else 'active-high'})"
+                            for sig in sig_data['resets']
+                        ))
             
             # Verification Checklist
             if hasattr(parsed, 'checklist') and parsed.checklist:
                 with st.expander("Verification Checklist"):
                     cl = parsed.checklist
                     
-                    st.markdown("**Reset Tests:**")
-                    for test in cl.reset_tests[:3]:
-                        st.markdown(f"- {test}")
-                    
-                    st.markdown("**Protocol Tests:**")
-                    for test in cl.protocol_tests[:4]:
-                        st.markdown(f"- {test}")
-                    
+                    # Build the whole checklist as one markdown block (one element instead of ~13)
+                    md = ["**Reset Tests:**", *(f"- {test}" for test in cl.reset_tests[:3])]
+                    md += ["", "**Protocol Tests:**", *(f"- {test}" for test in cl.protocol_tests[:4])]
                     if cl.fsm_tests and cl.fsm_tests[0] != "No FSM detected - verify sequential logic":
-                        st.markdown("**FSM Tests:**")
-                        for test in cl.fsm_tests[:3]:
-                            st.markdown(f"- {test}")
-                    
-                    st.markdown("**Edge Cases:**")
-                    for test in cl.edge_cases[:3]:
-                        st.markdown(f"- {test}")
+                        md += ["", "**FSM Tests:**", *(f"- {test}" for test in cl.fsm_tests[:3])]
+                    md += ["", "**Edge Cases:**", *(f"- {test}" for test in cl.edge_cases[:3])]
+                    st.markdown("\n".join(md))
             
             # Waveform Diagrams - Interactive WaveDrom
             if hasattr(parsed, 'complexity') and parsed.complexity:
                 protocol = parsed.complexity.detected_protocol
                 if protocol and protocol != "generic":
                     with st.expander("Interactive Protocol Timing", expanded=True):
-                        wavedrom_json = generate_wavedrom(protocol)
-                        render_wavedrom(wavedrom_json, height=200, key=f"wave_{protocol}")
+                        # Only rebuild the WaveDrom JSON when the detected protocol changes
+                        if ss.get('wd_proto') != protocol:
+                            ss['wd_proto'] = protocol
+                            ss['wd_json'] = generate_wavedrom(protocol)
+                        render_wavedrom(ss['wd_json'], height=200, key=f"wave_{protocol}")
             
             # Bug Prediction - NEW FEATURE
-            bugs = predict_bugs(parsed)
+            # predict_bugs only depends on the parsed RTL; recompute when a new analysis replaces it
+            # (kept alive and compared with `is`, like summary_src: an id() can be reused)
+            if ss.get('bugs_src') is not parsed:
+                ss['bugs'] = predict_bugs(parsed, complexity=parsed.complexity)
+                ss['bugs_src'] = parsed
+            bugs = ss['bugs']
             if bugs:
                 with st.expander("🔍 Predicted Verification Issues", expanded=True):
                     st.markdown("*AI-predicted bugs to verify against:*")
-                    for bug in bugs:
-                        severity_class = "bug-card-high" if bug['severity'] == 'high' else ""
-                        st.markdown(f'''<div class="bug-card {severity_class}">
+                    # All bug cards in one HTML block rather than one element per bug
+                    st.markdown("".join(
+                        f'''<div class="bug-card {'bug-card-high' if bug['severity'] == 'high' else ''}">
                             <div class="bug-title">⚠️ {bug['title']}</div>
                             <div class="bug-desc">{bug['description']}</div>
-                        </div>''', unsafe_allow_html=True)
+                        </div>'''
+                        for bug in bugs
+                    ), unsafe_allow_html=True)
             
             # Constraint Hints
             if hasattr(parsed, 'constraints') and parsed.constraints:
@@ -1574,9 +940,11 @@ with tabs[0]:
                         st.code(hint.constraint_code, language="systemverilog")
             
             # Generated code with Quality Score
-            if st.session_state.get('tb_result'):
+            if tb_result:
                 # Calculate and show quality score
-                quality = calculate_quality_score(parsed, st.session_state['tb_result'])
+                # Score and suggestions both scan the lowercased code; derive it once
+                gen_ctx = build_gen_context(tb_result)
+                quality = calculate_quality_score(parsed, tb_result, gen_ctx, complexity=parsed.complexity)
                 score = quality['score']
                 score_class = "score-high" if score >= 80 else ("score-medium" if score >= 60 else "score-low")
                 
@@ -1589,15 +957,10 @@ with tabs[0]:
                 
                 with col_breakdown:
                     bd = quality['breakdown']
-                    st.markdown(f'''<div class="stats-grid">
-                        <div class="stat-box"><div class="stat-value">{bd.get("completeness", 0)}/40</div><div class="stat-label">Completeness</div></div>
-                        <div class="stat-box"><div class="stat-value">{bd.get("protocol", 0)}/20</div><div class="stat-label">Protocol</div></div>
-                        <div class="stat-box"><div class="stat-value">{bd.get("coverage", 0)}/20</div><div class="stat-label">Coverage</div></div>
-                        <div class="stat-box"><div class="stat-value">{bd.get("quality", 0)}/20</div><div class="stat-label">UVM Best Practices</div></div>
-                    </div>''', unsafe_allow_html=True)
+                    st.markdown(QUALITY_STATS_TMPL.format(**bd), unsafe_allow_html=True)
                 
                 # Testbench Complexity Analysis
-                tb_metrics = analyze_testbench_complexity(st.session_state['tb_result'])
+                tb_metrics = analyze_testbench_complexity(tb_result)
                 with st.expander("📊 Testbench Complexity Analysis", expanded=False):
                     m1, m2, m3, m4 = st.columns(4)
                     m1.metric("Classes", tb_metrics['classes'])
@@ -1608,20 +971,27 @@ with tabs[0]:
                     st.progress(tb_metrics['complexity_score'] / 10)
                 
                 # Enhancement Suggestions
-                suggestions = generate_enhancement_suggestions(parsed, st.session_state['tb_result'])
+                suggestions = generate_enhancement_suggestions(parsed, tb_result, gen_ctx)
                 if suggestions:
                     with st.expander("💡 Enhancement Suggestions", expanded=False):
+                        # One markdown message for all suggestions: header block plus
+                        # fenced example per suggestion instead of markdown + expander + code each.
+                        blocks = []
                         for sug in suggestions:
                             priority_color = "#d73a49" if sug['priority'] == 'high' else ("#bf8700" if sug['priority'] == 'medium' else "#57606a")
-                            st.markdown(f'''<div style="border-left: 3px solid {priority_color}; padding-left: 10px; margin-bottom: 10px;">
-                                <strong>{sug['title']}</strong> <span style="color: {priority_color}; font-size: 0.8em;">({sug['priority'].upper()})</span><br/>
-                                <span style="color: #57606a;">{sug['description']}</span>
-                            </div>''', unsafe_allow_html=True)
-                            with st.expander(f"Show example for {sug['title']}", expanded=False):
-                                st.code(sug['example'], language="systemverilog")
+                            blocks.append(
+                                f'<div style="border-left: 3px solid {priority_color}; padding-left: 10px; margin-bottom: 10px;">'
+                                f"<strong>{sug['title']}</strong> <span style=\"color: {priority_color}; font-size: 0.8em;\">({sug['priority'].upper()})</span><br/>"
+                                f"<span style=\"color: #57606a;\">{sug['description']}</span></div>\n\n"
+                                f"```systemverilog\n{sug['example']}\n```\n"
+                            )
+                        st.markdown("\n".join(blocks), unsafe_allow_html=True)
                 
-                # UVM Component Tabs View
-                components_dict = parse_uvm_components(st.session_state['tb_result'])
+                # UVM Component Tabs View - split once per generated result
+                if ss.get('components_src') != tb_result:
+                    ss['components_src'] = tb_result
+                    ss['components_dict'] = parse_uvm_components(tb_result)
+                components_dict = ss['components_dict']
                 
                 # Always show the code first (default view)
                 st.markdown("### Generated Code")
@@ -1630,26 +1000,26 @@ with tabs[0]:
                     view_mode = st.radio("View Mode", ["Full Code", "Component Tabs"], horizontal=True, key="view_mode")
                     
                     if view_mode == "Component Tabs":
-                        comp_tabs = st.tabs(list(components_dict.keys()))
-                        for idx, (filename, content) in enumerate(components_dict.items()):
-                            with comp_tabs[idx]:
-                                st.code(content, language="systemverilog")
-                                st.download_button(
-                                    f"📄 Download {filename}",
-                                    content,
-                                    filename,
-                                    key=f"dl_{filename}",
-                                    use_container_width=True
-                                )
+                        # Highlight only the selected component instead of every file in a tab set
+                        filename = st.selectbox("Component", list(components_dict.keys()), key="component_preview")
+                        content = components_dict[filename]
+                        st.code(content, language="systemverilog")
+                        st.download_button(
+                            f"📄 Download {filename}",
+                            content,
+                            filename,
+                            key=f"dl_{filename}",
+                            use_container_width=True
+                        )
                     else:
-                        st.code(st.session_state['tb_result'], language="systemverilog")
+                        st.code(tb_result, language="systemverilog")
                 else:
-                    st.code(st.session_state['tb_result'], language="systemverilog")
+                    st.code(tb_result, language="systemverilog")
                 
                 # Performance metrics
-                if st.session_state.get('generation_time'):
-                    gen_time = st.session_state['generation_time']
-                    lines = len(st.session_state['tb_result'].split('\n'))
+                gen_time = ss.get('generation_time')
+                if gen_time:
+                    lines = len(tb_result.split('\n'))
                     st.markdown(f'''<div class="perf-bar">
                         <div class="perf-item">⏱️ Generated in <span class="perf-value">{gen_time:.1f}s</span></div>
                         <div class="perf-item">📝 <span class="perf-value">{lines}</span> lines</div>
@@ -1661,13 +1031,13 @@ with tabs[0]:
                 with c1:
                     st.download_button(
                         "📄 .sv",
-                        st.session_state['tb_result'],
+                        tb_result,
                         f"{parsed.module_name}_tb.sv",
                         use_container_width=True
                     )
                 with c2:
                     # ZIP with simulator scripts
-                    zip_data = create_testbench_zip(parsed.module_name, st.session_state['tb_result'], parsed)
+                    zip_data = build_testbench_zip(parsed.module_name, tb_result)
                     st.download_button(
                         "📦 ZIP",
                         zip_data,
@@ -1677,7 +1047,7 @@ with tabs[0]:
                     )
                 with c3:
                     # HTML export
-                    html_data = create_html_export(parsed.module_name, st.session_state['tb_result'], parsed)
+                    html_data = create_html_export(parsed.module_name, tb_result, parsed)
                     st.download_button(
                         "🌐 HTML",
                         html_data,
@@ -1686,25 +1056,27 @@ with tabs[0]:
                         use_container_width=True
                     )
                 with c4:
-                    # JSON metadata
-                    json_data = json.dumps({
-                        'module': parsed.module_name,
-                        'protocol': parsed.complexity.detected_protocol if hasattr(parsed, 'complexity') and parsed.complexity else 'generic',
-                        'inputs': parsed.inputs,
-                        'outputs': parsed.outputs,
-                        'quality_score': score,
-                        'generated_at': datetime.now().isoformat()
-                    }, indent=2)
+                    # JSON metadata - serialized once per generated result
+                    if ss.get('meta_json_src') != tb_result:
+                        ss['meta_json_src'] = tb_result
+                        ss['meta_json'] = json.dumps({
+                            'module': parsed.module_name,
+                            'protocol': parsed.complexity.detected_protocol if hasattr(parsed, 'complexity') and parsed.complexity else 'generic',
+                            'inputs': parsed.inputs,
+                            'outputs': parsed.outputs,
+                            'quality_score': score,
+                            'generated_at': datetime.now().isoformat()
+                        }, indent=2).encode('utf-8')
                     st.download_button(
                         "📋 JSON",
-                        json_data,
+                        ss['meta_json'],
                         f"{parsed.module_name}_meta.json",
                         mime="application/json",
                         use_container_width=True
                     )
         
-        elif st.session_state.get('gen_error'):
-            st.error(f"Error: {st.session_state['gen_error']}")
+        elif gen_error:
+            st.error(f"Error: {gen_error}")
             st.info("Make sure your RTL code is valid Verilog or SystemVerilog")
         
         else:
@@ -1729,7 +1101,9 @@ with tabs[0]:
             """, unsafe_allow_html=True)
 
 # Tab 2: Protocol Templates
-with tabs[1]:
+@st.fragment
+def render_protocol_tab():
+    """Tab 2: generate a testbench from a protocol template"""
     col1, col2 = st.columns([1, 2], gap="medium")
     
     with col1:
@@ -1751,35 +1125,39 @@ with tabs[1]:
         
         protocol = st.selectbox("Select Protocol", ["APB", "AXI4-Lite", "UART", "SPI", "I2C"])
         
-        st.markdown("**Parameters:**")
+        # Parameter widgets only take effect on submit, so tweaking them doesn't rerun the page
+        with st.form("proto_form"):
+            st.markdown("**Parameters:**")
+        
+            if protocol == "APB":
+                addr_w = st.select_slider("Address Width (bits)", [8, 12, 16, 20, 24, 32], value=32)
+                data_w = st.select_slider("Data Width (bits)", [8, 16, 32], value=32)
+                config = {"addr_width": addr_w, "data_width": data_w, "protocol": "APB"}
+            elif protocol == "AXI4-Lite":
+                addr_w = st.select_slider("Address Width (bits)", [8, 12, 16, 20, 24, 32], value=32)
+                data_w = st.selectbox("Data Width (bits)", [32, 64])
+                config = {"addr_width": addr_w, "data_width": data_w, "protocol": "AXI4-Lite"}
+            elif protocol == "UART":
+                baud = st.selectbox("Baud Rate", [9600, 19200, 38400, 57600, 115200])
+                parity = st.selectbox("Parity", ["None", "Even", "Odd"])
+                config = {"baud_rate": baud, "parity": parity, "protocol": "UART"}
+            elif protocol == "SPI":
+                mode = st.selectbox("SPI Mode", [0, 1, 2, 3])
+                width = st.select_slider("Data Width (bits)", [8, 16, 32], value=8)
+                config = {"mode": mode, "data_width": width, "protocol": "SPI"}
+            else:  # I2C
+                speed = st.selectbox("Speed Mode", ["Standard (100kHz)", "Fast (400kHz)", "Fast+ (1MHz)"])
+                addr_mode = st.selectbox("Address Mode", ["7-bit", "10-bit"])
+                config = {"speed": speed, "addr_mode": addr_mode, "protocol": "I2C"}
         
-        if protocol == "APB":
-            addr_w = st.select_slider("Address Width (bits)", [8, 12, 16, 20, 24, 32], value=32)
-            data_w = st.select_slider("Data Width (bits)", [8, 16, 32], value=32)
-            config = {"addr_width": addr_w, "data_width": data_w, "protocol": "APB"}
-        elif protocol == "AXI4-Lite":
-            addr_w = st.select_slider("Address Width (bits)", [8, 12, 16, 20, 24, 32], value=32)
-            data_w = st.selectbox("Data Width (bits)", [32, 64])
-            config = {"addr_width": addr_w, "data_width": data_w, "protocol": "AXI4-Lite"}
-        elif protocol == "UART":
-            baud = st.selectbox("Baud Rate", [9600, 19200, 38400, 57600, 115200])
-            parity = st.selectbox("Parity", ["None", "Even", "Odd"])
-            config = {"baud_rate": baud, "parity": parity, "protocol": "UART"}
-        elif protocol == "SPI":
-            mode = st.selectbox("SPI Mode", [0, 1, 2, 3])
-            width = st.select_slider("Data Width (bits)", [8, 16, 32], value=8)
-            config = {"mode": mode, "data_width": width, "protocol": "SPI"}
-        else:  # I2C
-            speed = st.selectbox("Speed Mode", ["Standard (100kHz)", "Fast (400kHz)", "Fast+ (1MHz)"])
-            addr_mode = st.selectbox("Address Mode", ["7-bit", "10-bit"])
-            config = {"speed": speed, "addr_mode": addr_mode, "protocol": "I2C"}
+            st.markdown("")
+            gen_proto = st.form_submit_button("Generate", type="primary", use_container_width=True)
         
-        st.markdown("")
-        if st.button("Generate", type="primary", use_container_width=True, key="gen_proto"):
+        if gen_proto:
             with st.spinner(f"Generating {protocol} testbench..."):
                 try:
                     # Use RTLAwareGenerator with protocol-specific sample RTL
-                    generator = RTLAwareGenerator()
+                    generator = get_rtl_generator()
                     
                     # Create minimal protocol-specific RTL for generation
                     if protocol == "APB":
@@ -1841,12 +1219,11 @@ endmodule'''
                     
                     generated_files = generator.generate_from_rtl(sample_rtl)
                     
-                    # Combine all generated files
-                    result_parts = []
-                    for filename, content in generated_files.items():
-                        result_parts.append(f"// ==================== {filename} ====================\n{content}")
-                    result = "\n\n".join(result_parts)
-                    st.session_state['proto_result'] = result
+                    # Combine all generated files (rendered in memory, never written to disk)
+                    st.session_state['proto_result'] = "\n\n".join(
+                        f"// ==================== {filename} ====================\n{content}"
+                        for filename, content in generated_files.items()
+                    )
                 except Exception as e:
                     st.session_state['proto_result'] = f"// Error generating testbench: {str(e)}"
     
@@ -1859,25 +1236,22 @@ endmodule'''
         wavedrom_json = generate_wavedrom(protocol_key)
         render_wavedrom(wavedrom_json, height=200, key=f"proto_{protocol_key}")
         
-        if st.session_state.get('proto_result'):
+        proto_result = st.session_state.get('proto_result')
+        if proto_result:
             st.markdown("**Generated Code:**")
-            st.code(st.session_state['proto_result'], language="systemverilog")
+            st.code(proto_result, language="systemverilog")
             
             c1, c2 = st.columns(2)
             with c1:
                 st.download_button(
                     "📄 Download .sv",
-                    st.session_state['proto_result'],
+                    proto_result,
                     f"{protocol.lower().replace('-', '_')}_uvm_tb.sv",
                     use_container_width=True
                 )
             with c2:
                 # ZIP download for protocol template
-                zip_data = create_testbench_zip(
-                    protocol.lower().replace('-', '_'),
-                    st.session_state['proto_result'],
-                    None
-                )
+                zip_data = build_testbench_zip(protocol.lower().replace('-', '_'), proto_result)
                 st.download_button(
                     "📦 Download ZIP",
                     zip_data,
@@ -1915,7 +1289,9 @@ Cross Coverage:
   addr_write_cross: 67%
 '''
 
-with tabs[2]:
+@st.fragment
+def render_coverage_tab():
+    """Tab 3: analyze a coverage report for gaps"""
     col1, col2 = st.columns([1, 1], gap="medium")
     
     with col1:
@@ -1927,59 +1303,27 @@ with tabs[2]:
         if st.button("📋 Load Sample Report", key="load_sample_cov", use_container_width=True):
             st.session_state['cov_input'] = SAMPLE_COVERAGE_REPORT
         
+        # Outside the form: form widgets can't take on_change, and an unsubmitted draft would be lost
         cov_text = st.text_area(
             "Coverage",
             value=st.session_state.get('cov_input', ''),
             height=350,
             placeholder="Paste your coverage report here...\n\nSupported formats:\n- VCS URG reports\n- Questa coverage reports\n- Simple text summaries\n- JSON coverage data",
-            label_visibility="collapsed"
+            label_visibility="collapsed",
+            key="cov_text",
+            on_change=keep_draft,
+            args=("cov_text", "cov_input")
         )
         
-        if st.button("Analyze Coverage", type="primary", use_container_width=True, key="analyze"):
+        with st.form("cov_form"):
+            cov_goal = st.slider("Coverpoint Goal (%)", 50, 100, 90, step=5)
+            analyze_cov = st.form_submit_button("Analyze Coverage", type="primary", use_container_width=True)
+        
+        if analyze_cov:
             if cov_text.strip():
                 with st.spinner("Analyzing coverage report..."):
                     try:
-                        # First try our simple regex parsing which works better
-                        import re
-                        
-                        # Parse overall/total coverage - multiple patterns
-                        total = 0.0
-                        patterns = [
-                            r'[Oo]verall\s*[Cc]overage[:\s]+([\d.]+)\s*%',
-                            r'[Tt]otal\s*[Cc]overage[:\s]+([\d.]+)\s*%',
-                            r'[Oo]verall[:\s]+([\d.]+)\s*%',
-                            r'[Tt]otal[:\s]+([\d.]+)\s*%',
-                            r'[Cc]overage[:\s]+([\d.]+)\s*%',
-                        ]
-                        for pattern in patterns:
-                            match = re.search(pattern, cov_text)
-                            if match:
-                                total = float(match.group(1))
-                                break
-                        
-                        # Parse coverpoint percentages
-                        cp_matches = re.findall(r'([\w_]+)(?:_cp)?[:\s-]+\s*([\d.]+)\s*%', cov_text)
-                        gaps = []
-                        for name, pct in cp_matches:
-                            pct_val = float(pct)
-                            if pct_val < 90:
-                                gaps.append(f"{name}: {pct_val:.0f}% (needs {90-pct_val:.0f}% more)")
-                        
-                        # Parse uncovered bins
-                        uncovered = re.findall(r'bin\s+([\w_]+)[^\n]*(?:0\s*hits|UNCOVERED)', cov_text, re.IGNORECASE)
-                        suggestions = [f"Add test to hit bin '{u}'" for u in uncovered[:10]]
-                        
-                        # Also look for general uncovered items
-                        uncovered2 = re.findall(r'([\w_]+)[:\s]*0\s*hits', cov_text)
-                        for u in uncovered2[:5]:
-                            if u not in uncovered:
-                                suggestions.append(f"Create sequence to cover '{u}'")
-                        
-                        st.session_state['cov_result'] = {
-                            'total_coverage': total,
-                            'gaps': gaps,
-                            'suggestions': suggestions
-                        }
+                        st.session_state['cov_result'] = analyze_coverage_text(cov_text, cov_goal)
                     except Exception as e:
                         st.error(f"Error analyzing: {str(e)}")
             else:
@@ -1988,8 +1332,8 @@ with tabs[2]:
     with col2:
         st.markdown('<div class="card-title">Analysis Results</div>', unsafe_allow_html=True)
         
-        if st.session_state.get('cov_result'):
-            analysis = st.session_state['cov_result']
+        analysis = st.session_state.get('cov_result')
+        if analysis:
             
             # Overall metric
             total_cov = analysis.get('total_coverage', 0)
@@ -2003,18 +1347,13 @@ with tabs[2]:
             gaps = analysis.get('gaps', [])
             if gaps:
                 st.markdown("**📉 Coverage Gaps Identified:**")
-                for gap in gaps[:10]:
-                    if isinstance(gap, str):
-                        st.warning(gap)
-                    else:
-                        st.warning(str(gap))
+                st.warning("\n".join(f"- {gap}" for gap in gaps[:10]))
             
             # Suggestions
             suggestions = analysis.get('suggestions', [])
             if suggestions:
                 st.markdown("**💡 Recommended Actions:**")
-                for i, s in enumerate(suggestions[:5], 1):
-                    st.info(f"{i}. {s}")
+                st.info("\n".join(f"{i}. {s}" for i, s in enumerate(suggestions[:5], 1)))
             
             # Generate sequence code for gaps
             if gaps or suggestions:
@@ -2051,7 +1390,9 @@ endclass'''
             st.info("👆 Paste a coverage report and click **Analyze Coverage** to see results.\n\nOr click **Load Sample Report** to try with example data.")
 
 # Tab 4: SVA Generator
-with tabs[3]:
+@st.fragment
+def render_sva_tab():
+    """Tab 4: generate SVA assertions from RTL or a description"""
     col1, col2 = st.columns([1, 1], gap="medium")
     
     with col1:
@@ -2059,15 +1400,21 @@ with tabs[3]:
         
         # SVA Library Browser
         with st.expander("📚 SVA Pattern Library", expanded=False):
-            st.markdown("*Click to copy common assertion patterns:*")
-            for key, sva in SVA_LIBRARY.items():
-                with st.container():
-                    st.markdown(f"**{sva['name']}** - {sva['description']}")
-                    st.caption(f"Usage: {sva['usage']}")
-                    st.code(sva['code'], language="systemverilog")
-                    if st.button(f"Copy {key}", key=f"copy_sva_{key}"):
-                        st.session_state['sva_clipboard'] = sva['code']
-                        st.success("Copied to clipboard!")
+            st.markdown("*Pick a common assertion pattern to view and copy:*")
+            # Show one pattern at a time instead of rendering every entry's widgets
+            key = st.selectbox(
+                "Pattern",
+                list(SVA_LIBRARY),
+                format_func=lambda k: SVA_LIBRARY[k]['name'],
+                key="sva_lib_choice"
+            )
+            sva = SVA_LIBRARY[key]
+            st.markdown(f"**{sva['name']}** - {sva['description']}")
+            st.caption(f"Usage: {sva['usage']}")
+            st.code(sva['code'], language="systemverilog")
+            if st.button(f"Copy {key}", key="copy_sva"):
+                st.session_state['sva_clipboard'] = sva['code']
+                st.success("Copied to clipboard!")
         
         mode = st.radio("Input Type", ["From RTL Code", "From Description"], horizontal=True)
         
@@ -2079,13 +1426,18 @@ with tabs[3]:
             with c2:
                 if st.button("Load AXI", key="sva_axi"):
                     st.session_state['sva_input'] = SAMPLE_AXI
-            
+        
+        # No form here: form widgets can't take on_change, and an unsubmitted draft would be lost
+        if mode == "From RTL Code":
             sva_input = st.text_area(
                 "RTL",
                 value=st.session_state.get('sva_input', ''),
                 height=320,
                 placeholder="// Paste RTL code to generate protocol-aware assertions",
-                label_visibility="collapsed"
+                label_visibility="collapsed",
+                key="sva_text",
+                on_change=keep_draft,
+                args=("sva_text", "sva_input")
             )
         else:
             sva_input = st.text_area(
@@ -2100,23 +1452,17 @@ with tabs[3]:
 - FIFO full flag should prevent writes""",
                 label_visibility="collapsed"
             )
+        gen_sva = st.button("Generate Assertions", type="primary", use_container_width=True, key="gen_sva")
         
-        if st.button("Generate Assertions", type="primary", use_container_width=True, key="gen_sva"):
+        if gen_sva:
             if sva_input.strip():
                 with st.spinner("Generating SVA assertions..."):
                     try:
                         if mode == "From RTL Code":
-                            parsed = parse_rtl(sva_input)
-                            # SVAGenerator expects ParsedRTL, SimpleParsedRTL has _parsed attribute
-                            if hasattr(parsed, '_parsed'):
-                                sva_gen = SVAGenerator(parsed._parsed)
-                            else:
-                                sva_gen = SVAGenerator(parsed)
-                            sva_module = sva_gen.generate_all()
-                            result = sva_module.to_sv()
+                            module_name, result, count = generate_sva_text(sva_input)
                             st.session_state['sva_result'] = result
-                            st.session_state['sva_module'] = parsed.module_name
-                            st.session_state['sva_count'] = result.count('assert property') + result.count('property ')
+                            st.session_state['sva_module'] = module_name
+                            st.session_state['sva_count'] = count
                         else:
                             # Generate assertions from natural language description
                             lines = sva_input.strip().split('\n')
@@ -2179,15 +1525,17 @@ endproperty''')
     with col2:
         st.markdown('<div class="card-title">Generated Assertions</div>', unsafe_allow_html=True)
         
-        if st.session_state.get('sva_result'):
-            count = st.session_state.get('sva_count', 0)
+        ss = st.session_state
+        sva_result = ss.get('sva_result')
+        if sva_result:
+            count = ss.get('sva_count', 0)
             st.success(f"Generated {count} assertions")
             
-            st.code(st.session_state['sva_result'], language="systemverilog")
+            st.code(sva_result, language="systemverilog")
             st.download_button(
                 "Download Assertions",
-                st.session_state['sva_result'],
-                f"{st.session_state.get('sva_module', 'assertions')}_sva.sv",
+                sva_result,
+                f"{ss.get('sva_module', 'assertions')}_sva.sv",
                 use_container_width=True
             )
         else:
@@ -2200,44 +1548,61 @@ endproperty''')
             </div>
             """, unsafe_allow_html=True)
 
-# Tab 5: Register Map
-with tabs[4]:
-    col1, col2 = st.columns([1, 1], gap="medium")
-    
-    with col1:
-        st.markdown('<div class="card-title">Register Specification</div>', unsafe_allow_html=True)
-        
-        st.markdown("Import register specifications from IP-XACT, SystemRDL, CSV, or JSON formats.")
-        
-        spec_format = st.selectbox("Format", ["CSV (Simple)", "JSON", "IP-XACT XML", "SystemRDL"])
-        
-        if spec_format == "CSV (Simple)":
-            sample_spec = """name,address,width,access,reset,description
+# Sample register specs shown in the Tab 5 editor, keyed by format
+SAMPLE_REG_SPECS = {
+    "CSV (Simple)": """name,address,width,access,reset,description
 CTRL,0x00,32,RW,0x00000000,Control register
 STATUS,0x04,32,RO,0x00000001,Status register
 DATA,0x08,32,RW,0x00000000,Data register
 IRQ_EN,0x0C,32,RW,0x00000000,Interrupt enable
-IRQ_STATUS,0x10,32,RO,0x00000000,Interrupt status"""
-        elif spec_format == "JSON":
-            sample_spec = """{
+IRQ_STATUS,0x10,32,RO,0x00000000,Interrupt status""",
+    "JSON": """{
   "name": "my_peripheral",
   "registers": [
     {"name": "CTRL", "address": "0x00", "width": 32, "access": "RW", "reset": "0x0"},
     {"name": "STATUS", "address": "0x04", "width": 32, "access": "RO", "reset": "0x1"},
     {"name": "DATA", "address": "0x08", "width": 32, "access": "RW", "reset": "0x0"}
   ]
-}"""
-        else:
-            sample_spec = "<!-- Paste your IP-XACT or SystemRDL here -->"
+}""",
+}
+SAMPLE_REG_SPEC_DEFAULT = "<!-- Paste your IP-XACT or SystemRDL here -->"
+
+# Tab 5: Register Map
+@st.fragment
+def render_register_tab():
+    """Tab 5: import a register spec and generate a UVM register model"""
+    col1, col2 = st.columns([1, 1], gap="medium")
+    
+    with col1:
+        st.markdown('<div class="card-title">Register Specification</div>', unsafe_allow_html=True)
         
+        st.markdown("Import register specifications from IP-XACT, SystemRDL, CSV, or JSON formats.")
+        
+        spec_formats = ["CSV (Simple)", "JSON", "IP-XACT XML", "SystemRDL"]
+        spec_format = st.selectbox(
+            "Format",
+            spec_formats,
+            index=spec_formats.index(st.session_state.get('reg_format', spec_formats[0])),
+            key="reg_format_select",
+            on_change=keep_draft,
+            args=("reg_format_select", "reg_format")
+        )
+        
+        sample_spec = SAMPLE_REG_SPECS.get(spec_format, SAMPLE_REG_SPEC_DEFAULT)
+        
+        # The draft is kept with its format, so picking another format still loads that sample
+        draft_format, draft = st.session_state.get('reg_spec_input', (None, None))
         reg_spec = st.text_area(
             "Spec",
             height=300,
-            value=sample_spec,
-            label_visibility="collapsed"
+            value=draft if draft_format == spec_format else sample_spec,
+            label_visibility="collapsed",
+            key="reg_spec_text",
+            on_change=lambda: st.session_state.update(reg_spec_input=(spec_format, st.session_state['reg_spec_text']))
         )
+        gen_reg = st.button("Parse & Generate", type="primary", use_container_width=True, key="gen_reg")
         
-        if st.button("Parse & Generate", type="primary", use_container_width=True, key="gen_reg"):
+        if gen_reg:
             if reg_spec.strip():
                 with st.spinner("Parsing register specification..."):
                     try:
@@ -2267,8 +1632,8 @@ IRQ_STATUS,0x10,32,RO,0x00000000,Interrupt status"""
                             data = json_lib.loads(reg_spec)
                             registers = data.get('registers', [])
                         else:
-                            # Basic parsing for other formats
-                            registers = [{'name': 'REG0', 'address': '0x00', 'width': 32, 'access': 'RW', 'reset_value': '0x0'}]
+                            source_file = "spec.xml" if spec_format == "IP-XACT XML" else "spec.rdl"
+                            registers = parse_register_spec(reg_spec, source_file)
                         
                         st.session_state['reg_spec'] = {'registers': registers}
                         
@@ -2283,33 +1648,33 @@ IRQ_STATUS,0x10,32,RO,0x00000000,Interrupt status"""
     with col2:
         st.markdown('<div class="card-title">Register Map & Tests</div>', unsafe_allow_html=True)
         
-        if st.session_state.get('reg_spec'):
-            spec = st.session_state['reg_spec']
+        ss = st.session_state
+        spec = ss.get('reg_spec')
+        reg_result = ss.get('reg_result')
+        if spec:
             registers = spec.get('registers', []) if isinstance(spec, dict) else []
             
             st.success(f"Parsed {len(registers)} registers")
             
             # Display register table
             st.markdown("**Register Map:**")
-            reg_data = []
-            for reg in registers[:10]:
-                if isinstance(reg, dict):
-                    reg_data.append({
-                        "Name": reg.get('name', ''),
-                        "Address": reg.get('address', '0x00'),
-                        "Width": reg.get('width', 32),
-                        "Access": reg.get('access', 'RW'),
-                        "Reset": reg.get('reset_value', '0x0')
-                    })
-            
-            st.dataframe(reg_data, use_container_width=True, hide_index=True)
+            regs = [reg for reg in registers[:10] if isinstance(reg, dict)]
+            # Columnar build: one tuple per column instead of one dict per row
+            reg_columns = (
+                ("Name", tuple(reg.get('name', '') for reg in regs)),
+                ("Address", tuple(str(reg.get('address', '0x00')) for reg in regs)),
+                ("Width", tuple(reg.get('width', 32) for reg in regs)),
+                ("Access", tuple(reg.get('access', 'RW') for reg in regs)),
+                ("Reset", tuple(str(reg.get('reset_value', '0x0')) for reg in regs)),
+            )
+            st.dataframe(build_register_df(reg_columns), use_container_width=True, hide_index=True)
             
-            if st.session_state.get('reg_result'):
+            if reg_result:
                 st.markdown("**Generated UVM Register Model:**")
-                st.code(st.session_state['reg_result'], language="systemverilog")
+                st.code(reg_result, language="systemverilog")
                 st.download_button(
                     "Download Register Model",
-                    st.session_state['reg_result'],
+                    reg_result,
                     "reg_model.sv",
                     use_container_width=True
                 )
@@ -2323,6 +1688,15 @@ IRQ_STATUS,0x10,32,RO,0x00000000,Interrupt status"""
             </div>
             """, unsafe_allow_html=True)
 
+TAB_RENDERERS = {
+    "RTL to Testbench": render_rtl_tab,
+    "Protocol Templates": render_protocol_tab,
+    "Coverage Analysis": render_coverage_tab,
+    "SVA Assertions": render_sva_tab,
+    "Register Map": render_register_tab,
+}
+TAB_RENDERERS[active_tab]()
+
 # Footer with stats
 stats = st.session_state.get('generation_stats', {'total': 0, 'protocols': {}, 'avg_time': 0})
 stats_text = ""
@@ -3,21 +3,54 @@ Helper functions for UVMForge app
 Extracted for testability
 """
 
-import json
 import io
+import json
 import re
 import zipfile
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 from datetime import datetime
 
 
+@dataclass(frozen=True)
+class GenContext:
+    """Derived views of one generated testbench, shared by the scoring/suggestion helpers"""
+    code: str
+    code_lower: str
+
+
+def build_gen_context(code: str) -> GenContext:
+    """Lowercase the generated code once for every helper that needs it"""
+    return GenContext(code=code, code_lower=code.lower())
+
+
+# File separator emitted by the generator, e.g. "// ===== driver.sv ====="
+COMPONENT_SEPARATOR_RE = re.compile(r'// ==+\s*(\S+\.sv)\s*==+')
+
+# Fallback: identify components by class definitions (compiled once, checked in order)
+COMPONENT_PATTERNS = [
+    (re.compile(pattern, re.DOTALL | re.IGNORECASE), filename)
+    for pattern, filename in (
+        (r'interface\s+\w+.*?endinterface', 'interface.sv'),
+        (r'class\s+\w+_seq_item\s+extends.*?endclass', 'seq_item.sv'),
+        (r'class\s+\w+_driver\s+extends.*?endclass', 'driver.sv'),
+        (r'class\s+\w+_monitor\s+extends.*?endclass', 'monitor.sv'),
+        (r'class\s+\w+_agent\s+extends.*?endclass', 'agent.sv'),
+        (r'class\s+\w+_scoreboard\s+extends.*?endclass', 'scoreboard.sv'),
+        (r'class\s+\w+_coverage\s+extends.*?endclass', 'coverage.sv'),
+        (r'class\s+\w+_env\s+extends.*?endclass', 'env.sv'),
+        (r'class\s+\w+_sequence\s+extends.*?endclass', 'sequence.sv'),
+        (r'class\s+\w+_test\s+extends.*?endclass', 'test.sv'),
+    )
+]
+
+
 def parse_uvm_components(code: str) -> Dict[str, str]:
     """Parse generated code into separate UVM components for tabbed view"""
     components = {}
     
     # Split by the file separator pattern
-    pattern = r'// ==+\s*(\S+\.sv)\s*==+'
-    parts = re.split(pattern, code)
+    parts = COMPONENT_SEPARATOR_RE.split(code)
     
     if len(parts) > 1:
         # Parts alternate between content and filename
@@ -29,22 +62,8 @@ def parse_uvm_components(code: str) -> Dict[str, str]:
                     components[filename] = content
     
     if not components:
-        # Try to identify components by class definitions
-        component_patterns = {
-            'interface': (r'interface\s+\w+.*?endinterface', 'interface.sv'),
-            'transaction': (r'class\s+\w+_seq_item\s+extends.*?endclass', 'seq_item.sv'),
-            'driver': (r'class\s+\w+_driver\s+extends.*?endclass', 'driver.sv'),
-            'monitor': (r'class\s+\w+_monitor\s+extends.*?endclass', 'monitor.sv'),
-            'agent': (r'class\s+\w+_agent\s+extends.*?endclass', 'agent.sv'),
-            'scoreboard': (r'class\s+\w+_scoreboard\s+extends.*?endclass', 'scoreboard.sv'),
-            'coverage': (r'class\s+\w+_coverage\s+extends.*?endclass', 'coverage.sv'),
-            'env': (r'class\s+\w+_env\s+extends.*?endclass', 'env.sv'),
-            'sequence': (r'class\s+\w+_sequence\s+extends.*?endclass', 'sequence.sv'),
-            'test': (r'class\s+\w+_test\s+extends.*?endclass', 'test.sv'),
-        }
-        
-        for comp_type, (pattern, filename) in component_patterns.items():
-            matches = re.findall(pattern, code, re.DOTALL | re.IGNORECASE)
+        for regex, filename in COMPONENT_PATTERNS:
+            matches = regex.findall(code)
             if matches:
                 components[filename] = '\n\n'.join(matches)
         
@@ -105,26 +124,24 @@ def get_signal_explorer_data(parsed: Any) -> Dict[str, List[Dict]]:
     if not parsed:
         return explorer_data
     
+    # Width maps are optional on the parsed object; look them up once, not per signal
+    input_widths = getattr(parsed, 'input_widths', None) or {}
+    output_widths = getattr(parsed, 'output_widths', None) or {}
+    
     # Process inputs
     for sig in getattr(parsed, 'inputs', []):
-        width = 1  # Default
-        if hasattr(parsed, 'input_widths') and sig in parsed.input_widths:
-            width = parsed.input_widths[sig]
         explorer_data['inputs'].append({
             'name': sig,
-            'width': width,
+            'width': input_widths.get(sig, 1),
             'type': 'input',
             'category': 'control' if any(k in sig.lower() for k in ['clk', 'rst', 'en', 'sel']) else 'data'
         })
     
     # Process outputs
     for sig in getattr(parsed, 'outputs', []):
-        width = 1
-        if hasattr(parsed, 'output_widths') and sig in parsed.output_widths:
-            width = parsed.output_widths[sig]
         explorer_data['outputs'].append({
             'name': sig,
-            'width': width,
+            'width': output_widths.get(sig, 1),
             'type': 'output',
             'category': 'control' if any(k in sig.lower() for k in ['ready', 'valid', 'done', 'err']) else 'data'
         })
@@ -150,11 +167,12 @@ def get_signal_explorer_data(parsed: Any) -> Dict[str, List[Dict]]:
     return explorer_data
 
 
-def generate_enhancement_suggestions(parsed: Any, code: str) -> List[Dict[str, str]]:
+def generate_enhancement_suggestions(parsed: Any, code: str,
+                                     ctx: Optional[GenContext] = None) -> List[Dict[str, str]]:
     """Generate suggestions for testbench improvements"""
     suggestions = []
     
-    code_lower = code.lower()
+    code_lower = ctx.code_lower if ctx else code.lower()
     
     # Check for missing components
     if 'covergroup' not in code_lower:
@@ -208,14 +226,15 @@ assert property(p_handshake);'''
 `uvm_error("SCOREBOARD", "Data mismatch detected!")'''
         })
     
-    if parsed and hasattr(parsed, 'complexity') and parsed.complexity:
-        if parsed.complexity.has_fsm:
+    cx = getattr(parsed, 'complexity', None)
+    if cx:
+        if cx.has_fsm:
             if 'fsm' not in code_lower and 'state' not in code_lower:
                 suggestions.append({
                     'type': 'fsm',
                     'priority': 'high',
                     'title': 'Add FSM Coverage',
-                    'description': f'Design has FSM with {parsed.complexity.fsm_states} states. Add coverage for state transitions.',
+                    'description': f'Design has FSM with {cx.fsm_states} states. Add coverage for state transitions.',
                     'example': '''covergroup cg_fsm_states;
   cp_state: coverpoint dut.state {
     bins idle = {IDLE};
@@ -250,77 +269,120 @@ endclass'''
     
     return suggestions[:5]  # Return top 5 suggestions
 
+
+# WaveDrom timing diagrams per protocol key
+WAVEDROMS = {
+    "apb": {
+        "signal": [
+            {"name": "PCLK", "wave": "p........"},
+            {"name": "PSEL", "wave": "0.1....0."},
+            {"name": "PENABLE", "wave": "0..1...0."},
+            {"name": "PWRITE", "wave": "0.1....0."},
+            {"name": "PADDR", "wave": "x.3....x.", "data": ["ADDR"]},
+            {"name": "PWDATA", "wave": "x.4....x.", "data": ["DATA"]},
+            {"name": "PREADY", "wave": "0....1.0."},
+            {"name": "PRDATA", "wave": "x.....5x.", "data": ["RDATA"]}
+        ],
+        "head": {"text": "APB Write Transaction", "tick": 0}
+    },
+    "axi4lite": {
+        "signal": [
+            {"name": "ACLK", "wave": "p........."},
+            {"name": "AWVALID", "wave": "0.1..0...."},
+            {"name": "AWREADY", "wave": "0...10...."},
+            {"name": "AWADDR", "wave": "x.3..x....", "data": ["ADDR"]},
+            {"name": "WVALID", "wave": "0....1.0.."},
+            {"name": "WREADY", "wave": "0.....10.."},
+            {"name": "WDATA", "wave": "x....4.x..", "data": ["DATA"]},
+            {"name": "BVALID", "wave": "0.......1."},
+            {"name": "BREADY", "wave": "1........."}
+        ],
+        "head": {"text": "AXI4-Lite Write Transaction", "tick": 0}
+    },
+    "spi": {
+        "signal": [
+            {"name": "SCLK", "wave": "0.hlhlhlhl"},
+            {"name": "CS_N", "wave": "10.......1"},
+            {"name": "MOSI", "wave": "x.34567890", "data": ["7","6","5","4","3","2","1","0"]},
+            {"name": "MISO", "wave": "x.90876543", "data": ["7","6","5","4","3","2","1","0"]}
+        ],
+        "head": {"text": "SPI Mode 0 Transfer (8-bit)", "tick": 0}
+    },
+    "uart": {
+        "signal": [
+            {"name": "TX", "wave": "1.0.3.4.5.6.7.8.9.0.1.1", "data": ["ST","0","1","2","3","4","5","6","7","SP"]}
+        ],
+        "head": {"text": "UART Frame (8N1)", "tick": 0},
+        "foot": {"text": "Start bit, 8 data bits, Stop bit"}
+    },
+    "i2c": {
+        "signal": [
+            {"name": "SCL", "wave": "1.0h.l.h.l.h.l.h.l.h.l.h1"},
+            {"name": "SDA", "wave": "1.0..3...4...5...6...0..1", "data": ["A6","A5","A4","ACK"]}
+        ],
+        "head": {"text": "I2C Start + Address", "tick": 0}
+    }
+}
+
+# The diagrams never change, so serialize them once at import
+WAVEDROM_JSON = {key: json.dumps(diagram) for key, diagram in WAVEDROMS.items()}
+
+
+def _normalize_protocol(protocol: str) -> str:
+    """Fold case, dashes and '4_' so e.g. 'AXI4-Lite' and 'axi4_lite' both become 'axi4lite'"""
+    return protocol.lower().replace("-", "").replace("4_", "4")
+
+
+# Spellings the app and parser actually pass (canonical keys, detector output,
+# the Protocol tab's display names), resolved ahead of time
+WAVEDROM_KEYS = {
+    spelling: _normalize_protocol(spelling)
+    for key in WAVEDROMS
+    for spelling in (key, key.upper())
+}
+WAVEDROM_KEYS.update((name, _normalize_protocol(name)) for name in ("AXI4-Lite", "axi4-lite", "axi4_lite"))
+
+
 def generate_wavedrom(protocol: str) -> str:
     """Generate WaveDrom JSON for protocol timing diagrams"""
-    wavedroms = {
-        "apb": {
-            "signal": [
-                {"name": "PCLK", "wave": "p........"},
-                {"name": "PSEL", "wave": "0.1....0."},
-                {"name": "PENABLE", "wave": "0..1...0."},
-                {"name": "PWRITE", "wave": "0.1....0."},
-                {"name": "PADDR", "wave": "x.3....x.", "data": ["ADDR"]},
-                {"name": "PWDATA", "wave": "x.4....x.", "data": ["DATA"]},
-                {"name": "PREADY", "wave": "0....1.0."},
-                {"name": "PRDATA", "wave": "x.....5x.", "data": ["RDATA"]}
-            ],
-            "head": {"text": "APB Write Transaction", "tick": 0}
-        },
-        "axi4lite": {
-            "signal": [
-                {"name": "ACLK", "wave": "p........."},
-                {"name": "AWVALID", "wave": "0.1..0...."},
-                {"name": "AWREADY", "wave": "0...10...."},
-                {"name": "AWADDR", "wave": "x.3..x....", "data": ["ADDR"]},
-                {"name": "WVALID", "wave": "0....1.0.."},
-                {"name": "WREADY", "wave": "0.....10.."},
-                {"name": "WDATA", "wave": "x....4.x..", "data": ["DATA"]},
-                {"name": "BVALID", "wave": "0.......1."},
-                {"name": "BREADY", "wave": "1........."}
-            ],
-            "head": {"text": "AXI4-Lite Write Transaction", "tick": 0}
-        },
-        "spi": {
-            "signal": [
-                {"name": "SCLK", "wave": "0.hlhlhlhl"},
-                {"name": "CS_N", "wave": "10.......1"},
-                {"name": "MOSI", "wave": "x.34567890", "data": ["7","6","5","4","3","2","1","0"]},
-                {"name": "MISO", "wave": "x.90876543", "data": ["7","6","5","4","3","2","1","0"]}
-            ],
-            "head": {"text": "SPI Mode 0 Transfer (8-bit)", "tick": 0}
-        },
-        "uart": {
-            "signal": [
-                {"name": "TX", "wave": "1.0.3.4.5.6.7.8.9.0.1.1", "data": ["ST","0","1","2","3","4","5","6","7","SP"]}
-            ],
-            "head": {"text": "UART Frame (8N1)", "tick": 0},
-            "foot": {"text": "Start bit, 8 data bits, Stop bit"}
-        },
-        "i2c": {
-            "signal": [
-                {"name": "SCL", "wave": "1.0h.l.h.l.h.l.h.l.h.l.h1"},
-                {"name": "SDA", "wave": "1.0..3...4...5...6...0..1", "data": ["A6","A5","A4","ACK"]}
-            ],
-            "head": {"text": "I2C Start + Address", "tick": 0}
-        }
-    }
-    return json.dumps(wavedroms.get(protocol.lower().replace("-", "").replace("4_", "4"), wavedroms["apb"]))
+    key = WAVEDROM_KEYS.get(protocol)
+    if key is None:
+        key = _normalize_protocol(protocol)
+    return WAVEDROM_JSON.get(key, WAVEDROM_JSON["apb"])
+
+
+# UVM components whose presence counts toward completeness. Matched as plain
+# substrings on purpose: generated names are prefixed (apb_driver, apb_env), so
+# word-boundary matching would miss them.
+QUALITY_COMPONENTS = ('interface', 'driver', 'monitor', 'scoreboard', 'coverage', 'agent', 'env', 'sequence', 'test')
 
+# Completeness points (out of 40) indexed by how many QUALITY_COMPONENTS were found
+COMPLETENESS_POINTS = tuple(int((found / len(QUALITY_COMPONENTS)) * 40) for found in range(len(QUALITY_COMPONENTS) + 1))
 
-def calculate_quality_score(parsed: Any, generated_code: str) -> Dict[str, Any]:
-    """Calculate testbench quality score"""
+# (lowercase token, points) code-quality indicators
+QUALITY_TOKENS = (('uvm_info', 5), ('uvm_error', 5), ('virtual interface', 5))
+
+
+def calculate_quality_score(parsed: Any, generated_code: str,
+                            ctx: Optional[GenContext] = None, *,
+                            complexity: Optional[Any] = None) -> Dict[str, Any]:
+    """Calculate testbench quality score (pass ``complexity`` to skip reading it off ``parsed``)"""
     score = 0
     breakdown = {}
+    # Lowercase once (or reuse the caller's copy); every case-insensitive check scans
+    # it. Each `in` is a C-level search that stops at the first hit, which beats a
+    # single pass that has to report every occurrence of ~15 tokens back to Python.
+    code_lower = ctx.code_lower if ctx else generated_code.lower()
     
     # Component completeness (40 points)
-    components = ['interface', 'driver', 'monitor', 'scoreboard', 'coverage', 'agent', 'env', 'sequence', 'test']
-    found = sum(1 for c in components if c in generated_code.lower())
-    breakdown['completeness'] = int((found / len(components)) * 40)
+    found = sum(1 for c in QUALITY_COMPONENTS if c in code_lower)
+    breakdown['completeness'] = COMPLETENESS_POINTS[found]
     score += breakdown['completeness']
     
     # Protocol awareness (20 points)
-    if parsed and hasattr(parsed, 'complexity') and parsed.complexity:
-        if parsed.complexity.detected_protocol != "generic":
+    cx = complexity if complexity is not None else getattr(parsed, 'complexity', None)
+    if cx:
+        if cx.detected_protocol != "generic":
             breakdown['protocol'] = 20
         else:
             breakdown['protocol'] = 10
@@ -329,75 +391,98 @@ def calculate_quality_score(parsed: Any, generated_code: str) -> Dict[str, Any]:
     score += breakdown['protocol']
     
     # Coverage potential (20 points)
-    if 'covergroup' in generated_code.lower() or 'coverpoint' in generated_code.lower():
+    if 'covergroup' in code_lower or 'coverpoint' in code_lower:
         breakdown['coverage'] = 20
-    elif 'coverage' in generated_code.lower():
+    elif 'coverage' in code_lower:
         breakdown['coverage'] = 10
     else:
         breakdown['coverage'] = 5
     score += breakdown['coverage']
     
     # Code quality indicators (20 points)
-    quality = 0
-    if 'uvm_info' in generated_code.lower(): quality += 5
-    if 'uvm_error' in generated_code.lower(): quality += 5
-    if '`uvm_' in generated_code: quality += 5
-    if 'virtual interface' in generated_code.lower(): quality += 5
+    quality = sum(points for token, points in QUALITY_TOKENS if token in code_lower)
+    if '`uvm_' in generated_code: quality += 5  # macro check stays case-sensitive
     breakdown['quality'] = quality
     score += quality
     
     return {'score': min(score, 100), 'breakdown': breakdown}
 
 
-def predict_bugs(parsed: Any) -> List[Dict[str, str]]:
-    """Predict likely verification bugs based on RTL analysis"""
+# Known verification pitfalls per detected protocol, most critical first.
+# predict_bugs returns copies, so callers may modify or serialize what they get.
+PROTOCOL_BUGS = {
+    "apb": (
+        {
+            'severity': 'high',
+            'title': 'PREADY Timing',
+            'description': 'APB slave may not handle PREADY deasserted case properly - ensure wait state testing'
+        },
+        {
+            'severity': 'medium',
+            'title': 'Back-to-Back Transactions',
+            'description': 'Sequential transactions without idle cycles may cause data corruption'
+        },
+    ),
+    "axi4lite": (
+        {
+            'severity': 'high',
+            'title': 'Handshake Deadlock',
+            'description': 'AXI VALID/READY handshake may deadlock if VALID waits for READY'
+        },
+        {
+            'severity': 'medium',
+            'title': 'Outstanding Transactions',
+            'description': 'Multiple outstanding transactions may cause response ordering issues'
+        },
+    ),
+    "spi": (
+        {
+            'severity': 'high',
+            'title': 'Clock Phase/Polarity',
+            'description': 'SPI mode mismatch (CPOL/CPHA) causes bit-shifted data'
+        },
+    ),
+    "uart": (
+        {
+            'severity': 'medium',
+            'title': 'Baud Rate Mismatch',
+            'description': 'Clock frequency drift may cause framing errors'
+        },
+    ),
+    "i2c": (
+        {
+            'severity': 'high',
+            'title': 'Clock Stretching',
+            'description': 'Slave clock stretching not handled may cause data loss'
+        },
+    ),
+}
+
+# predict_bugs returns at most this many (the first ones, in the order the checks run)
+MAX_PREDICTED_BUGS = 5
+
+# Reset pitfall does not depend on the design; predict_bugs appends a copy
+RESET_RACE_BUG = {
+    'severity': 'medium',
+    'title': 'Reset Race Condition',
+    'description': 'Async reset release near clock edge may cause metastability'
+}
+
+
+def predict_bugs(parsed: Any, *, complexity: Optional[Any] = None) -> List[Dict[str, str]]:
+    """Predict likely verification bugs based on RTL analysis.
+    
+    Callers that already hold the design's complexity can pass it to skip the
+    lookup on ``parsed``; ``parsed`` may then be None (no reset check is done).
+    """
     bugs = []
     
-    if parsed and hasattr(parsed, 'complexity') and parsed.complexity:
-        cx = parsed.complexity
+    cx = complexity if complexity is not None else getattr(parsed, 'complexity', None)
+    if cx:
         protocol = cx.detected_protocol
         
         # Common protocol-specific bugs
-        if protocol == "apb":
-            bugs.append({
-                'severity': 'high',
-                'title': 'PREADY Timing',
-                'description': 'APB slave may not handle PREADY deasserted case properly - ensure wait state testing'
-            })
-            bugs.append({
-                'severity': 'medium', 
-                'title': 'Back-to-Back Transactions',
-                'description': 'Sequential transactions without idle cycles may cause data corruption'
-            })
-        elif protocol == "axi4lite":
-            bugs.append({
-                'severity': 'high',
-                'title': 'Handshake Deadlock',
-                'description': 'AXI VALID/READY handshake may deadlock if VALID waits for READY'
-            })
-            bugs.append({
-                'severity': 'medium',
-                'title': 'Outstanding Transactions',
-                'description': 'Multiple outstanding transactions may cause response ordering issues'
-            })
-        elif protocol == "spi":
-            bugs.append({
-                'severity': 'high',
-                'title': 'Clock Phase/Polarity',
-                'description': 'SPI mode mismatch (CPOL/CPHA) causes bit-shifted data'
-            })
-        elif protocol == "uart":
-            bugs.append({
-                'severity': 'medium',
-                'title': 'Baud Rate Mismatch',
-                'description': 'Clock frequency drift may cause framing errors'
-            })
-        elif protocol == "i2c":
-            bugs.append({
-                'severity': 'high',
-                'title': 'Clock Stretching',
-                'description': 'Slave clock stretching not handled may cause data loss'
-            })
+        bugs.extend(dict(rec) for rec in PROTOCOL_BUGS.get(protocol, ()))
         
         # FSM-related bugs
         if cx.has_fsm and cx.fsm_states > 2:
@@ -408,12 +493,8 @@ def predict_bugs(parsed: Any) -> List[Dict[str, str]]:
             })
         
         # Reset-related bugs
-        if parsed.resets:
-            bugs.append({
-                'severity': 'medium',
-                'title': 'Reset Race Condition',
-                'description': 'Async reset release near clock edge may cause metastability'
-            })
+        if getattr(parsed, 'resets', None):
+            bugs.append(dict(RESET_RACE_BUG))
         
         # Data width bugs
         if cx.data_width >= 32:
@@ -423,19 +504,15 @@ def predict_bugs(parsed: Any) -> List[Dict[str, str]]:
                 'description': f'{cx.data_width}-bit data may have byte lane issues on partial writes'
             })
     
-    return bugs[:5]  # Return top 5 bugs
+    return bugs[:MAX_PREDICTED_BUGS]
 
 
-def create_testbench_zip(module_name: str, generated_code: str, parsed: Any) -> bytes:
-    """Create ZIP file with testbench and scripts"""
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-        # Main testbench file
-        zf.writestr(f"tb/{module_name}_tb_pkg.sv", generated_code)
-        
-        # Interface file
-        interface_code = f'''// Auto-generated interface for {module_name}
+# Timestamp stamped on every archive member (the ZIP epoch) for reproducible output
+ZIP_MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+# Static members of the testbench ZIP; {module_name} is the only placeholder
+TB_INTERFACE_TMPL = '''// Auto-generated interface for {module_name}
 interface {module_name}_if(input logic clk);
     // TODO: Add signals from generated testbench
     clocking cb @(posedge clk);
@@ -446,10 +523,8 @@ interface {module_name}_if(input logic clk);
     modport MON(clocking cb);
 endinterface
 '''
-        zf.writestr(f"tb/{module_name}_if.sv", interface_code)
-        
-        # Makefile for VCS
-        vcs_makefile = f'''# Makefile for VCS simulation
+
+VCS_MAKEFILE_TMPL = '''# Makefile for VCS simulation
 TB_TOP = {module_name}_tb_top
 DUT = ../rtl/{module_name}.sv
 
@@ -480,10 +555,8 @@ clean:
 
 .PHONY: compile run run_cov clean
 '''
-        zf.writestr("tb/Makefile.vcs", vcs_makefile)
-        
-        # Makefile for Questa
-        questa_makefile = f'''# Makefile for Questa simulation
+
+QUESTA_MAKEFILE_TMPL = '''# Makefile for Questa simulation
 TB_TOP = {module_name}_tb_top
 DUT = ../rtl/{module_name}.sv
 
@@ -514,10 +587,8 @@ clean:
 
 .PHONY: compile run gui clean
 '''
-        zf.writestr("tb/Makefile.questa", questa_makefile)
-        
-        # README
-        readme = f'''# {module_name} UVM Testbench
+
+TB_README_TMPL = '''# {module_name} UVM Testbench
 Generated by UVMForge - https://uvmforge.app
 
 ## Directory Structure
@@ -559,12 +630,55 @@ make -f Makefile.questa run
 - Environment
 - Base Test
 '''
-        zf.writestr("README.md", readme)
+
+# (archive path, content template) pairs written after the main testbench file
+TESTBENCH_ZIP_MEMBERS = (
+    ("tb/{module_name}_if.sv", TB_INTERFACE_TMPL),
+    ("tb/Makefile.vcs", VCS_MAKEFILE_TMPL),
+    ("tb/Makefile.questa", QUESTA_MAKEFILE_TMPL),
+    ("README.md", TB_README_TMPL),
+)
+
+
+def create_testbench_zip(module_name: str, generated_code: str, parsed: Any,
+                         out: Optional[BinaryIO] = None) -> Optional[bytes]:
+    """Create ZIP file with testbench and scripts.
+    
+    With ``out`` the archive is written straight into that writable binary stream
+    and None is returned; otherwise the archive is built in memory and its bytes
+    are returned. Callers that must not hold the whole archive should pass ``out``.
+    """
+    if out is not None:
+        _write_testbench_zip(out, module_name, generated_code)
+        return None
     
-    zip_buffer.seek(0)
+    zip_buffer = io.BytesIO()
+    _write_testbench_zip(zip_buffer, module_name, generated_code)
     return zip_buffer.getvalue()
 
 
+def _zip_member(name: str, compress_type: int = zipfile.ZIP_STORED) -> zipfile.ZipInfo:
+    """ZipInfo with a fixed timestamp, so identical input gives identical archive bytes"""
+    info = zipfile.ZipInfo(name, date_time=ZIP_MEMBER_DATE_TIME)
+    info.compress_type = compress_type
+    info.external_attr = 0o644 << 16  # regular file, rw-r--r--
+    return info
+
+
+def _write_testbench_zip(out: BinaryIO, module_name: str, generated_code: str) -> None:
+    """Write the testbench archive members into a writable binary stream"""
+    # Scripts and README are a few KB of text; storing them uncompressed skips the DEFLATE pass
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_STORED) as zf:
+        # Main testbench file - the one large member, so it gets fast (level 1) DEFLATE
+        zf.writestr(_zip_member(f"tb/{module_name}_tb_pkg.sv", zipfile.ZIP_DEFLATED),
+                    generated_code, compresslevel=1)
+        
+        # Interface stub, build scripts and README, filled in for this module
+        fields = {'module_name': module_name}
+        for member, template in TESTBENCH_ZIP_MEMBERS:
+            zf.writestr(_zip_member(member.format_map(fields)), template.format_map(fields))
+
+
 def validate_rtl_syntax(code: str) -> Dict[str, Any]:
     """Basic RTL syntax validation"""
     errors = []
@@ -8,11 +8,21 @@ It actually reads your coverage data and suggests targeted tests.
 """
 
 import re
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Iterable
 from enum import Enum
-from pathlib import Path
 import json
+import sys
+try:
+    # orjson parses large JSON coverage dumps several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
+# slots=True (no per-instance __dict__: smaller bins, faster attribute access) needs
+# Python 3.10+; on 3.9 these dataclasses stay dict-backed.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class CoverageType(Enum):
@@ -29,7 +39,7 @@ class CoverageStatus(Enum):
     PARTIAL = "partial"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CoverageBin:
     """Represents a single coverage bin"""
     name: str
@@ -48,59 +58,70 @@ class CoverageBin:
         return min(100.0, (self.hits / self.goal) * 100)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CoverPoint:
     """Represents a coverpoint with bins"""
     name: str
     bins: List[CoverageBin] = field(default_factory=list)
     expression: str = ""
     
+    @property
+    def covered_count(self) -> int:
+        # Same test as CoverageBin.is_covered, inlined: the property call dominates on big reports
+        return sum(b.hits >= b.goal for b in self.bins)
+    
     @property
     def coverage_pct(self) -> float:
         if not self.bins:
             return 0.0
-        covered = sum(1 for b in self.bins if b.is_covered)
-        return (covered / len(self.bins)) * 100
+        return (self.covered_count / len(self.bins)) * 100
     
     @property
     def uncovered_bins(self) -> List[CoverageBin]:
         return [b for b in self.bins if not b.is_covered]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CrossCoverage:
     """Represents cross coverage"""
     name: str
     coverpoints: List[str]
     bins: List[CoverageBin] = field(default_factory=list)
     
+    @property
+    def covered_count(self) -> int:
+        # Same test as CoverageBin.is_covered, inlined: the property call dominates on big reports
+        return sum(b.hits >= b.goal for b in self.bins)
+    
     @property
     def coverage_pct(self) -> float:
         if not self.bins:
             return 0.0
-        covered = sum(1 for b in self.bins if b.is_covered)
-        return (covered / len(self.bins)) * 100
+        return (self.covered_count / len(self.bins)) * 100
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Covergroup:
     """Represents a covergroup"""
     name: str
     coverpoints: List[CoverPoint] = field(default_factory=list)
     crosses: List[CrossCoverage] = field(default_factory=list)
     
+    @property
+    def bin_counts(self) -> Tuple[int, int]:
+        """(covered, total) bins across all coverpoints and crosses"""
+        groups = self.coverpoints + self.crosses
+        return sum(g.covered_count for g in groups), sum(len(g.bins) for g in groups)
+    
     @property
     def coverage_pct(self) -> float:
-        total_bins = sum(len(cp.bins) for cp in self.coverpoints)
-        total_bins += sum(len(cr.bins) for cr in self.crosses)
+        covered, total_bins = self.bin_counts
         if total_bins == 0:
             return 0.0
-        covered = sum(sum(1 for b in cp.bins if b.is_covered) for cp in self.coverpoints)
-        covered += sum(sum(1 for b in cr.bins if b.is_covered) for cr in self.crosses)
         return (covered / total_bins) * 100
 
 
-@dataclass 
+@dataclass(**DATACLASS_SLOTS)
 class CoverageGap:
     """Represents a coverage gap that needs to be closed"""
     covergroup: str
@@ -117,7 +138,7 @@ class CoverageGap:
     hits_needed: int = 1
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SuggestedSequence:
     """A suggested UVM sequence to close a coverage gap"""
     name: str
@@ -127,7 +148,7 @@ class SuggestedSequence:
     expected_coverage_gain: float = 0.0
     
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CoverageReport:
     """Complete coverage report"""
     source_file: str
@@ -140,6 +161,132 @@ class CoverageReport:
         return self.total_coverage
 
 
+# One pattern for every line kind parse_text_summary understands; alternatives are
+# tried in the same order the old per-line checks ran, and the outer named group
+# (read back via Match.lastgroup) says which kind of line matched. Bin names exclude
+# ':' so they cannot overlap the separator that follows (no backtracking into it).
+# parse_text_summary runs it MULTILINE over the whole text, so whitespace inside a
+# match is [^\S\n] rather than \s: a match must never run on into the next line.
+SUMMARY_LINE_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<overall>overall[^\S\n]*(?:coverage)?(?:[^\S\n]|:)+(?P<overall_pct>\d+(?:\.\d+)?)[^\S\n]*%)'
+    r'|(?P<cg>(?:covergroup|cg)(?:[^\S\n]|:)+(?P<cg_name>\w+))'
+    r'|(?P<cp>(?:coverpoint|cp)(?:[^\S\n]|:)+(?P<cp_name>\w+))'
+    r'|(?P<bin>bin[^\S\n]+(?P<bin_name>[^\s<:][^\s:]*)(?:[^\S\n]|:)+'
+    r'(?P<bin_hits>\d+)/(?P<bin_goal>\d+)[^\S\n]*\(\d+(?:\.\d+)?[^\S\n]*%\))'
+    r'|(?P<cross>cross(?:[^\S\n]|:)+(?P<cross_name>\S+))'
+    r'|(?P<cross_bin>bin[^\S\n]+<(?P<cross_values>[^>\n]+)>(?:[^\S\n]|:)+'
+    r'(?P<cross_hits>\d+)/(?P<cross_goal>\d+)[^\S\n]*\(\d+(?:\.\d+)?[^\S\n]*%\))'
+    r')',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Line pattern for CoverageParser's simple text format, dispatched on Match.lastgroup the
+# same way as SUMMARY_LINE_RE. Every whitespace run is [^\S\n] (the leading one skips what
+# str.strip() would) and . does not match '\n', so a match never leaves its line and the
+# pattern gives the same result per line and with finditer over the whole text.
+SIMPLE_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'(?P<cg>(?:covergroup|cg)[^\S\n]+(?P<cg_name>\w+).*?\d+(?:\.\d+)?[^\S\n]*%)'
+    r'|(?P<cp>(?:coverpoint|cp)[^\S\n]+(?P<cp_name>\w+).*?\d+(?:\.\d+)?[^\S\n]*%)'
+    r'|(?P<bin>(?:bin|bins)[^\S\n]+(?P<bin_name>\w+).*?(?:hits?[=:]?[^\S\n]*)?(?P<bin_hits>\d+))'
+    r')',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Bin-name keywords that make a partially hit coverpoint bin a high-priority gap
+HIGH_PRIORITY_BIN_RE = re.compile(r'error|boundary|edge')
+
+# Bin-name keywords for CoverageAnalyzer._classify_priority (matched against lowercased names):
+# error scenarios and boundary cases are high priority, catch-all bins are low
+GAP_HIGH_PRIORITY_RE = re.compile(r'error|fail|timeout|illegal|boundary|edge|corner')
+GAP_LOW_PRIORITY_RE = re.compile(r'default|other|misc')
+
+# Tool banners (URG, Questa/ModelSim) sit at the top of a report, so only this many leading
+# characters are lowercased and searched for them. VCS, Questa and simple text reports all
+# go through the same line parser, so a banner further down never changes the result.
+FORMAT_SNIFF_CHARS = 1024
+
+# Gap sort order: high first, unknown priorities sort with low
+GAP_PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+
+def _covergroups_from_matches(matches: Iterable[re.Match],
+                              bins_have_goal: bool = True) -> Tuple[List[Covergroup], float]:
+    """
+    Build covergroups from per-line matches of SUMMARY_LINE_RE or SIMPLE_LINE_RE.
+    
+    Both text parsers share this state machine, dispatching on Match.lastgroup.
+    Pass bins_have_goal=False for patterns whose bin lines carry only a hit count
+    (goal 1, i.e. covered once hit). Returns the covergroups and the reported
+    overall coverage (0.0 if there was no such line).
+    """
+    covergroups = []
+    overall_coverage = 0.0
+    
+    current_cg = None
+    current_cp = None
+    
+    for m in matches:
+        kind = m.lastgroup
+        
+        # Overall coverage
+        if kind == 'overall':
+            overall_coverage = float(m.group('overall_pct'))
+        
+        # Covergroup line
+        elif kind == 'cg':
+            if current_cg:
+                covergroups.append(current_cg)
+            current_cg = Covergroup(name=m.group('cg_name'))
+        
+        # Coverpoint line
+        elif kind == 'cp':
+            if current_cg:
+                current_cp = CoverPoint(name=m.group('cp_name'))
+                current_cg.coverpoints.append(current_cp)
+        
+        # Bin line: "bin name: hits/goal (pct%)" (simple format: "bin name hits")
+        elif kind == 'bin':
+            if current_cp:
+                if bins_have_goal:
+                    name, hits, goal = m.group('bin_name', 'bin_hits', 'bin_goal')
+                    goal = int(goal)
+                else:
+                    name, hits = m.group('bin_name', 'bin_hits')
+                    goal = 1
+                hits = int(hits)
+                current_cp.bins.append(CoverageBin(
+                    name=name,
+                    hits=hits,
+                    goal=goal,
+                    status=CoverageStatus.COVERED if hits >= goal else CoverageStatus.UNCOVERED
+                ))
+        
+        # Cross line
+        elif kind == 'cross':
+            if current_cg:
+                current_cg.crosses.append(CrossCoverage(name=m.group('cross_name'), coverpoints=[]))
+        
+        # Cross bin line: "bin <val1, val2>: hits/goal (pct%)"
+        elif kind == 'cross_bin':
+            if current_cg and current_cg.crosses:
+                values, hits, goal = m.group('cross_values', 'cross_hits', 'cross_goal')
+                hits = int(hits)
+                goal = int(goal)
+                current_cg.crosses[-1].bins.append(CoverageBin(
+                    name=f"<{values}>",
+                    hits=hits,
+                    goal=goal,
+                    status=CoverageStatus.COVERED if hits >= goal else CoverageStatus.UNCOVERED
+                ))
+    
+    if current_cg:
+        covergroups.append(current_cg)
+    
+    return covergroups, overall_coverage
+
+
 class CoverageParser:
     """
     Parses coverage reports from various EDA tools.
@@ -162,20 +309,55 @@ class CoverageParser:
         else:
             return self._parse_simple(content)
     
+    def parse_file(self, file_path: str, format_type: str = "auto") -> CoverageReport:
+        """
+        Parse a coverage report file without loading it all into memory.
+        
+        Format detection makes one line-by-line pass; text formats are then
+        parsed from the open file directly. JSON still needs the whole
+        document and is read in one go.
+        """
+        with open(file_path) as f:
+            if format_type == "auto":
+                format_type = self._detect_format_lines(f)
+                f.seek(0)
+            if format_type == "json":
+                return self._parse_json(f.read())
+            return self._parse_simple_lines(f)
+    
     def _detect_format(self, content: str) -> str:
         """Detect coverage report format"""
-        if '"covergroups"' in content or '"coverage"' in content:
-            return "json"
-        elif "URG" in content or "vcs" in content.lower():
+        return self._detect_format_lines((content,))
+    
+    def _detect_format_lines(self, chunks: Iterable[str]) -> str:
+        """Detect coverage report format from consecutive pieces of the report"""
+        # None of the markers span a newline, so checking piece by piece finds the
+        # same ones as checking the whole text; JSON still takes precedence. Tool
+        # banners are only looked for in the report's head (see FORMAT_SNIFF_CHARS).
+        is_vcs = is_questa = False
+        sniffed = 0
+        for chunk in chunks:
+            if '"covergroups"' in chunk or '"coverage"' in chunk:
+                return "json"
+            if sniffed >= FORMAT_SNIFF_CHARS:
+                continue
+            head = chunk[:FORMAT_SNIFF_CHARS - sniffed]
+            sniffed += len(head)
+            head_lower = head.lower()
+            if not is_vcs:
+                is_vcs = "URG" in head or "vcs" in head_lower
+            if not is_questa:
+                is_questa = "questa" in head_lower or "modelsim" in head_lower
+        if is_vcs:
             return "vcs"
-        elif "questa" in content.lower() or "modelsim" in content.lower():
+        elif is_questa:
             return "questa"
         else:
             return "simple"
     
     def _parse_json(self, content: str) -> CoverageReport:
         """Parse JSON coverage format"""
-        data = json.loads(content)
+        data = self._load_json(content)
         
         covergroups = []
         for cg_data in data.get('covergroups', []):
@@ -206,42 +388,27 @@ class CoverageParser:
             covergroups=covergroups
         )
     
+    @staticmethod
+    def _load_json(content: str) -> Any:
+        """json.loads, via orjson when it is installed"""
+        if orjson is not None:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity, huge ints or invalid JSON: let json decide and raise
+        return json.loads(content)
+    
     def _parse_simple(self, content: str) -> CoverageReport:
         """Parse simple text coverage format"""
-        covergroups = []
-        current_cg = None
-        current_cp = None
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            
-            # Covergroup
-            cg_match = re.match(r'(?:covergroup|cg)\s+(\w+).*?(\d+(?:\.\d+)?)\s*%', line, re.IGNORECASE)
-            if cg_match:
-                if current_cg:
-                    covergroups.append(current_cg)
-                current_cg = Covergroup(name=cg_match.group(1))
-                continue
-            
-            # Coverpoint
-            cp_match = re.match(r'(?:coverpoint|cp)\s+(\w+).*?(\d+(?:\.\d+)?)\s*%', line, re.IGNORECASE)
-            if cp_match and current_cg:
-                current_cp = CoverPoint(name=cp_match.group(1))
-                current_cg.coverpoints.append(current_cp)
-                continue
-            
-            # Bin
-            bin_match = re.match(r'(?:bin|bins)\s+(\w+).*?(?:hits?[=:]?\s*)?(\d+)', line, re.IGNORECASE)
-            if bin_match and current_cp:
-                hits = int(bin_match.group(2))
-                current_cp.bins.append(CoverageBin(
-                    name=bin_match.group(1),
-                    hits=hits,
-                    status=CoverageStatus.COVERED if hits > 0 else CoverageStatus.UNCOVERED
-                ))
-        
-        if current_cg:
-            covergroups.append(current_cg)
+        return self._simple_from_matches(SIMPLE_LINE_RE.finditer(content))
+    
+    def _parse_simple_lines(self, lines: Iterable[str]) -> CoverageReport:
+        """Parse simple text coverage format from an iterable of lines (e.g. an open file)"""
+        return self._simple_from_matches(filter(None, map(SIMPLE_LINE_RE.match, lines)))
+    
+    def _simple_from_matches(self, matches: Iterable[re.Match]) -> CoverageReport:
+        """Build a CoverageReport from SIMPLE_LINE_RE matches, one per recognised line"""
+        covergroups, _ = _covergroups_from_matches(matches, bins_have_goal=False)
         
         # Calculate total coverage
         total = 0.0
@@ -308,85 +475,31 @@ class CoverageAnalyzer:
         Parse a text-based coverage summary.
         This handles common human-readable formats from coverage tools.
         """
-        covergroups = []
-        overall_coverage = 0.0
-        
-        current_cg = None
-        current_cp = None
-        
-        lines = content.split('\n')
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # Overall coverage
-            overall_match = re.search(r'overall\s*(?:coverage)?[:\s]+(\d+(?:\.\d+)?)\s*%', line_stripped, re.IGNORECASE)
-            if overall_match:
-                overall_coverage = float(overall_match.group(1))
-                continue
-            
-            # Covergroup line
-            cg_match = re.match(r'(?:Covergroup|cg)[:\s]+(\w+)', line_stripped, re.IGNORECASE)
-            if cg_match:
-                if current_cg:
-                    covergroups.append(current_cg)
-                current_cg = Covergroup(name=cg_match.group(1))
-                continue
-            
-            # Coverpoint line
-            cp_match = re.match(r'(?:Coverpoint|cp)[:\s]+(\w+)', line_stripped, re.IGNORECASE)
-            if cp_match and current_cg:
-                current_cp = CoverPoint(name=cp_match.group(1))
-                current_cg.coverpoints.append(current_cp)
-                continue
-            
-            # Bin line: "bin name: hits/goal (pct%)"
-            bin_match = re.search(r'bin\s+(\S+)[:\s]+(\d+)/(\d+)\s*\((\d+(?:\.\d+)?)\s*%\)', line_stripped, re.IGNORECASE)
-            if bin_match and current_cp:
-                hits = int(bin_match.group(2))
-                goal = int(bin_match.group(3))
-                current_cp.bins.append(CoverageBin(
-                    name=bin_match.group(1),
-                    hits=hits,
-                    goal=goal,
-                    status=CoverageStatus.COVERED if hits >= goal else CoverageStatus.UNCOVERED
-                ))
-                continue
-            
-            # Cross line
-            cross_match = re.search(r'(?:Cross|cross)[:\s]+(\S+)', line_stripped, re.IGNORECASE)
-            if cross_match and current_cg:
-                cross = CrossCoverage(name=cross_match.group(1), coverpoints=[])
-                current_cg.crosses.append(cross)
-                continue
-            
-            # Cross bin line: "bin <val1, val2>: hits/goal (pct%)"
-            cross_bin_match = re.search(r'bin\s+<([^>]+)>[:\s]+(\d+)/(\d+)\s*\((\d+(?:\.\d+)?)\s*%\)', line_stripped, re.IGNORECASE)
-            if cross_bin_match and current_cg and current_cg.crosses:
-                hits = int(cross_bin_match.group(2))
-                goal = int(cross_bin_match.group(3))
-                current_cg.crosses[-1].bins.append(CoverageBin(
-                    name=f"<{cross_bin_match.group(1)}>",
-                    hits=hits,
-                    goal=goal,
-                    status=CoverageStatus.COVERED if hits >= goal else CoverageStatus.UNCOVERED
-                ))
-                continue
+        return self._summary_from_matches(SUMMARY_LINE_RE.finditer(content))
+    
+    def parse_text_summary_stream(self, lines: Iterable[str]) -> CoverageReport:
+        """
+        Parse a text coverage summary from an iterable of lines.
         
-        if current_cg:
-            covergroups.append(current_cg)
+        Lines are consumed lazily, so an open text file (or an
+        io.TextIOWrapper around an upload) can be parsed without
+        reading the whole report into memory first.
+        """
+        matches = (m for m in map(SUMMARY_LINE_RE.match, lines) if m)
+        return self._summary_from_matches(matches)
+    
+    def _summary_from_matches(self, matches: Iterable[re.Match]) -> CoverageReport:
+        """Build a CoverageReport from SUMMARY_LINE_RE matches, one per recognised line"""
+        covergroups, overall_coverage = _covergroups_from_matches(matches)
         
         # Calculate overall if not found
         if overall_coverage == 0.0 and covergroups:
             total_bins = 0
             covered_bins = 0
             for cg in covergroups:
-                for cp in cg.coverpoints:
-                    total_bins += len(cp.bins)
-                    covered_bins += len([b for b in cp.bins if b.is_covered])
-                for cr in cg.crosses:
-                    total_bins += len(cr.bins)
-                    covered_bins += len([b for b in cr.bins if b.is_covered])
+                covered, total = cg.bin_counts
+                covered_bins += covered
+                total_bins += total
             if total_bins > 0:
                 overall_coverage = (covered_bins / total_bins) * 100
         
@@ -401,14 +514,20 @@ class CoverageAnalyzer:
         Analyze a coverage report and return a list of gaps to close.
         """
         gaps = []
+        # A bin with hits >= goal >= 0 is at 100%, so with a target of at most 100% it
+        # cannot be a gap; skip those (usually most bins) without the coverage properties.
+        skip_full = target_coverage <= 100
         
         for cg in report.covergroups:
             # Coverpoint gaps
             for cp in cg.coverpoints:
                 for bin in cp.bins:
-                    if not bin.is_covered or bin.coverage_pct < target_coverage:
+                    if skip_full and bin.hits >= bin.goal >= 0:
+                        continue
+                    # coverage_pct is a computed property; evaluate it once per bin
+                    current_pct = bin.coverage_pct
+                    if not bin.is_covered or current_pct < target_coverage:
                         # Calculate how many more hits needed
-                        current_pct = bin.coverage_pct
                         hits_needed = max(1, bin.goal - bin.hits)
                         
                         # Determine priority
@@ -416,7 +535,7 @@ class CoverageAnalyzer:
                         bin_lower = bin.name.lower()
                         if bin.hits == 0:
                             priority = "high"
-                        elif any(x in bin_lower for x in ['error', 'boundary', 'edge']):
+                        elif HIGH_PRIORITY_BIN_RE.search(bin_lower):
                             priority = "high"
                         elif current_pct > 50:
                             priority = "low"
@@ -441,7 +560,10 @@ class CoverageAnalyzer:
             # Cross coverage gaps
             for cross in cg.crosses:
                 for bin in cross.bins:
-                    if not bin.is_covered or bin.coverage_pct < target_coverage:
+                    if skip_full and bin.hits >= bin.goal >= 0:
+                        continue
+                    current_pct = bin.coverage_pct
+                    if not bin.is_covered or current_pct < target_coverage:
                         hits_needed = max(1, bin.goal - bin.hits)
                         priority = "high" if bin.hits == 0 else "medium"
                         
@@ -458,14 +580,13 @@ class CoverageAnalyzer:
                             suggested_sequence=seq_name,
                             hit_count=bin.hits,
                             goal_count=bin.goal,
-                            current_coverage=bin.coverage_pct,
+                            current_coverage=current_pct,
                             target_coverage=target_coverage,
                             hits_needed=hits_needed
                         ))
         
         # Sort by priority then by coverage (lowest first)
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        gaps.sort(key=lambda g: (priority_order.get(g.priority, 2), g.current_coverage))
+        gaps.sort(key=lambda g: (GAP_PRIORITY_ORDER.get(g.priority, 2), g.current_coverage))
         
         return gaps
     
@@ -517,8 +638,9 @@ endclass'''
     
     def analyze_file(self, file_path: str) -> CoverageReport:
         """Analyze coverage from file"""
-        content = Path(file_path).read_text()
-        return self.analyze(content)
+        report = self.parser.parse_file(file_path)
+        report.gaps = self._find_gaps(report)
+        return report
     
     def _find_gaps(self, report: CoverageReport) -> List[CoverageGap]:
         """Find coverage gaps and suggest fixes"""
@@ -526,30 +648,22 @@ endclass'''
         
         for cg in report.covergroups:
             for cp in cg.coverpoints:
-                for bin in cp.uncovered_bins:
+                for bin in cp.bins:
+                    if bin.hits >= bin.goal:  # CoverageBin.is_covered, inlined
+                        continue
                     gap = self._create_gap(cg.name, cp.name, bin)
                     if gap:
                         gaps.append(gap)
         
         # Sort by priority
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        gaps.sort(key=lambda g: priority_order.get(g.priority, 2))
+        gaps.sort(key=lambda g: GAP_PRIORITY_ORDER.get(g.priority, 2))
         
         return gaps
     
     def _create_gap(self, cg_name: str, cp_name: str, bin: CoverageBin) -> Optional[CoverageGap]:
         """Create a coverage gap with suggested stimulus"""
-        # Analyze bin name to determine stimulus
-        bin_lower = bin.name.lower()
-        
         # Determine priority based on coverage type
-        priority = "medium"
-        if any(x in bin_lower for x in ['error', 'fail', 'timeout', 'illegal']):
-            priority = "high"  # Error scenarios are critical
-        elif any(x in bin_lower for x in ['boundary', 'edge', 'corner']):
-            priority = "high"  # Boundary cases are important
-        elif any(x in bin_lower for x in ['default', 'other', 'misc']):
-            priority = "low"
+        priority = self._classify_priority(bin.name)
         
         # Find matching stimulus pattern
         stimulus, sequence = self._suggest_stimulus(bin.name, cp_name)
@@ -564,54 +678,67 @@ endclass'''
             suggested_sequence=sequence
         )
     
-    def _suggest_stimulus(self, bin_name: str, cp_name: str) -> Tuple[str, str]:
-        """Suggest stimulus to hit the bin"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_priority(bin_name: str) -> str:
+        """Gap priority implied by a bin name (cached; bin names repeat across coverpoints)"""
+        bin_lower = bin_name.lower()
+        if GAP_HIGH_PRIORITY_RE.search(bin_lower):
+            return "high"
+        elif GAP_LOW_PRIORITY_RE.search(bin_lower):
+            return "low"
+        return "medium"
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _suggest_stimulus(cls, bin_name: str, cp_name: str) -> Tuple[str, str]:
+        """Suggest stimulus to hit the bin (cached per class and (bin, coverpoint) name pair)"""
         bin_lower = bin_name.lower()
         cp_lower = cp_name.lower()
         
         # Address-related
         if 'addr' in cp_lower or 'address' in cp_lower:
             if 'low' in bin_lower or 'small' in bin_lower:
-                return self.STIMULUS_PATTERNS['addr_low']['stimulus'], 'low_address_seq'
+                return cls.STIMULUS_PATTERNS['addr_low']['stimulus'], 'low_address_seq'
             elif 'high' in bin_lower or 'large' in bin_lower:
-                return self.STIMULUS_PATTERNS['addr_high']['stimulus'], 'high_address_seq'
+                return cls.STIMULUS_PATTERNS['addr_high']['stimulus'], 'high_address_seq'
             elif 'bound' in bin_lower or 'edge' in bin_lower:
-                return self.STIMULUS_PATTERNS['addr_boundary']['stimulus'], 'boundary_address_seq'
+                return cls.STIMULUS_PATTERNS['addr_boundary']['stimulus'], 'boundary_address_seq'
             else:
                 return f'addr = /* hit {bin_name} */', f'{bin_name}_seq'
         
         # Data-related
         if 'data' in cp_lower or 'wdata' in cp_lower or 'rdata' in cp_lower:
             if 'zero' in bin_lower:
-                return self.STIMULUS_PATTERNS['data_zero']['stimulus'], 'zero_data_seq'
+                return cls.STIMULUS_PATTERNS['data_zero']['stimulus'], 'zero_data_seq'
             elif 'one' in bin_lower or 'all_ones' in bin_lower:
-                return self.STIMULUS_PATTERNS['data_ones']['stimulus'], 'all_ones_seq'
+                return cls.STIMULUS_PATTERNS['data_ones']['stimulus'], 'all_ones_seq'
             elif 'pattern' in bin_lower or 'aa' in bin_lower or '55' in bin_lower:
-                return self.STIMULUS_PATTERNS['data_pattern']['stimulus'], 'pattern_data_seq'
+                return cls.STIMULUS_PATTERNS['data_pattern']['stimulus'], 'pattern_data_seq'
             else:
                 return f'data = /* hit {bin_name} */', f'{bin_name}_seq'
         
         # Operation type
         if 'op' in cp_lower or 'type' in cp_lower or 'write' in cp_lower:
             if 'read' in bin_lower:
-                return self.STIMULUS_PATTERNS['read']['stimulus'], 'read_only_seq'
+                return cls.STIMULUS_PATTERNS['read']['stimulus'], 'read_only_seq'
             elif 'write' in bin_lower:
-                return self.STIMULUS_PATTERNS['write']['stimulus'], 'write_only_seq'
+                return cls.STIMULUS_PATTERNS['write']['stimulus'], 'write_only_seq'
         
         # Burst length
         if 'len' in cp_lower or 'burst' in cp_lower or 'size' in cp_lower:
             if '1' in bin_lower or 'single' in bin_lower:
-                return self.STIMULUS_PATTERNS['burst_1']['stimulus'], 'single_burst_seq'
+                return cls.STIMULUS_PATTERNS['burst_1']['stimulus'], 'single_burst_seq'
             elif '4' in bin_lower:
-                return self.STIMULUS_PATTERNS['burst_4']['stimulus'], 'burst4_seq'
+                return cls.STIMULUS_PATTERNS['burst_4']['stimulus'], 'burst4_seq'
             elif '8' in bin_lower:
-                return self.STIMULUS_PATTERNS['burst_8']['stimulus'], 'burst8_seq'
+                return cls.STIMULUS_PATTERNS['burst_8']['stimulus'], 'burst8_seq'
             elif '16' in bin_lower:
-                return self.STIMULUS_PATTERNS['burst_16']['stimulus'], 'burst16_seq'
+                return cls.STIMULUS_PATTERNS['burst_16']['stimulus'], 'burst16_seq'
         
         # Error scenarios
         if 'error' in cp_lower or 'err' in bin_lower:
-            return self.STIMULUS_PATTERNS['error_inject']['stimulus'], 'error_injection_seq'
+            return cls.STIMULUS_PATTERNS['error_inject']['stimulus'], 'error_injection_seq'
         
         # Default
         return f'/* Constrain to hit {bin_name} */', f'{bin_name}_targeted_seq'
@@ -641,18 +768,14 @@ class {module_name}_coverage_closure_seq extends {module_name}_base_seq;
         # Group gaps by coverpoint
         gaps_by_cp: Dict[str, List[CoverageGap]] = {}
         for gap in report.gaps:
-            key = f"{gap.covergroup}.{gap.coverpoint}"
-            if key not in gaps_by_cp:
-                gaps_by_cp[key] = []
-            gaps_by_cp[key].append(gap)
+            gaps_by_cp.setdefault(f"{gap.covergroup}.{gap.coverpoint}", []).append(gap)
         
         for cp_key, gaps in gaps_by_cp.items():
             sequences.append(f'''
         // === Close gaps in {cp_key} ===''')
-            for gap in gaps:
-                sequences.append(f'''
+            sequences.extend(f'''
         // Gap: {gap.bin_name} (Priority: {gap.priority})
-        `uvm_do_with(req, {{ {gap.suggested_stimulus}; }})''')
+        `uvm_do_with(req, {{ {gap.suggested_stimulus}; }})''' for gap in gaps)
         
         sequences.append('''
         
@@ -662,9 +785,8 @@ class {module_name}_coverage_closure_seq extends {module_name}_base_seq;
 endclass
 ''')
         
-        # Generate individual targeted sequences
-        for gap in report.gaps[:10]:  # Top 10 gaps
-            sequences.append(f'''
+        # Generate individual targeted sequences for the top 10 gaps
+        sequences.extend(f'''
 // Targeted sequence for: {gap.covergroup}.{gap.coverpoint}.{gap.bin_name}
 class {gap.suggested_sequence} extends {module_name}_base_seq;
     `uvm_object_utils({gap.suggested_sequence})
@@ -680,7 +802,7 @@ class {gap.suggested_sequence} extends {module_name}_base_seq;
     endtask
     
 endclass
-''')
+''' for gap in report.gaps[:10])
         
         return '\n'.join(sequences)
     
@@ -698,9 +820,13 @@ endclass
             lines.append("Coverage Gaps by Priority:")
             lines.append("-" * 60)
             
-            high_gaps = [g for g in report.gaps if g.priority == 'high']
-            med_gaps = [g for g in report.gaps if g.priority == 'medium']
-            low_gaps = [g for g in report.gaps if g.priority == 'low']
+            # Bucket gaps by priority in a single pass
+            gaps_by_priority: Dict[str, List[CoverageGap]] = {'high': [], 'medium': [], 'low': []}
+            for gap in report.gaps:
+                gaps_by_priority.setdefault(gap.priority, []).append(gap)
+            high_gaps = gaps_by_priority['high']
+            med_gaps = gaps_by_priority['medium']
+            low_gaps = gaps_by_priority['low']
             
             if high_gaps:
                 lines.append(f"\n🔴 HIGH PRIORITY ({len(high_gaps)} gaps):")
@@ -28,11 +28,15 @@ class UVMGenerator:
             template_dir = Path(__file__).parent.parent / "templates"
         
         self.template_dir = Path(template_dir)
+        # Templates ship with the package, so skip per-render mtime checks and
+        # keep every compiled template cached for the life of the generator
         self.env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=400
         )
         
         # Add custom filters
@@ -41,6 +45,9 @@ class UVMGenerator:
         self.env.filters['lower'] = str.lower
         self.env.filters['snake_case'] = self._to_snake_case
         
+        # Compiled templates per protocol: (template, output pattern, category)
+        self._compiled: Dict[str, List[tuple]] = {}
+        
     def _to_snake_case(self, name: str) -> str:
         """Convert string to snake_case"""
         import re
@@ -61,44 +68,40 @@ class UVMGenerator:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Build template context
-        context = self._build_context(spec)
+        generated_files = self.generate_in_memory(spec)
         
-        # Get templates for the protocol
-        templates = self._get_protocol_templates(spec.protocol)
+        # Write files
+        for generated in generated_files:
+            output_file = output_path / generated.filename
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            output_file.write_text(generated.content)
         
-        generated_files = []
+        return generated_files
+    
+    def generate_in_memory(self, spec: ParsedSpec) -> List[GeneratedFile]:
+        """
+        Render all UVM files for the given specification without writing them.
         
-        for template_info in templates:
-            template_name = template_info["template"]
-            output_name = template_info["output"].format(**context)
-            category = template_info.get("category", "misc")
-            
-            # Check if template exists
-            template_path = self.template_dir / template_name
-            if not template_path.exists():
-                print(f"  ⚠ Template not found: {template_name}")
-                continue
-            
-            # Render template
-            template = self.env.get_template(template_name)
-            content = template.render(**context)
-            
-            # Write file
-            output_file = output_path / output_name
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(content)
+        Args:
+            spec: Parsed specification
             
-            generated_files.append(GeneratedFile(
-                filename=output_name,
-                content=content,
+        Returns:
+            List of generated files (the Makefile last)
+        """
+        # Build template context
+        context = self._build_context(spec)
+        
+        generated_files = [
+            GeneratedFile(
+                filename=output.format(**context),
+                content=template.render(**context),
                 category=category
-            ))
+            )
+            for template, output, category in self._compile_protocol_templates(spec.protocol)
+        ]
         
         # Generate Makefile
         makefile_content = self._generate_makefile(spec, generated_files)
-        makefile_path = output_path / "Makefile"
-        makefile_path.write_text(makefile_content)
         generated_files.append(GeneratedFile(
             filename="Makefile",
             content=makefile_content,
@@ -198,6 +201,28 @@ class UVMGenerator:
             "i2c_multi_master": spec.i2c_multi_master,
         }
     
+    def _compile_protocol_templates(self, protocol: str) -> List[tuple]:
+        """Look up and compile a protocol's templates once per generator"""
+        compiled = self._compiled.get(protocol)
+        if compiled is None:
+            compiled = []
+            for template_info in self._get_protocol_templates(protocol):
+                template_name = template_info["template"]
+                
+                # Check if template exists
+                template_path = self.template_dir / template_name
+                if not template_path.exists():
+                    print(f"  ⚠ Template not found: {template_name}")
+                    continue
+                
+                compiled.append((
+                    self.env.get_template(template_name),
+                    template_info["output"],
+                    template_info.get("category", "misc")
+                ))
+            self._compiled[protocol] = compiled
+        return compiled
+    
     def _get_protocol_templates(self, protocol: str) -> List[Dict[str, str]]:
         """Get list of templates for a protocol"""
         
@@ -3,10 +3,13 @@ LLM Client - Handles communication with various LLM providers
 Supports: OpenAI, Anthropic, Ollama (local), Google Gemini
 """
 
+import asyncio
+import hashlib
 import os
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 
 # Load environment variables from .env file
@@ -34,6 +37,14 @@ class BaseLLMClient(ABC):
     def is_available(self) -> bool:
         """Check if this LLM provider is available"""
         pass
+    
+    def generate_stream(self, prompt: str, system_prompt: str = "") -> Iterator[str]:
+        """Yield response text as it arrives (default: a single chunk from generate())"""
+        yield self.generate(prompt, system_prompt).content
+    
+    async def agenerate(self, prompt: str, system_prompt: str = "") -> LLMResponse:
+        """Async generate (default: run the blocking generate() in a worker thread)"""
+        return await asyncio.to_thread(self.generate, prompt, system_prompt)
 
 
 class OpenAIClient(BaseLLMClient):
@@ -76,6 +87,25 @@ class OpenAIClient(BaseLLMClient):
             model=self.model,
             tokens_used=response.usage.total_tokens if response.usage else 0
         )
+    
+    def generate_stream(self, prompt: str, system_prompt: str = "") -> Iterator[str]:
+        client = self._get_client()
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        stream = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=4096,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
 
 class AnthropicClient(BaseLLMClient):
@@ -113,6 +143,18 @@ class AnthropicClient(BaseLLMClient):
             model=self.model,
             tokens_used=response.usage.input_tokens + response.usage.output_tokens
         )
+    
+    def generate_stream(self, prompt: str, system_prompt: str = "") -> Iterator[str]:
+        client = self._get_client()
+        
+        with client.messages.stream(
+            model=self.model,
+            max_tokens=4096,
+            system=system_prompt if system_prompt else "You are a helpful assistant.",
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
 
 
 class OllamaClient(BaseLLMClient):
@@ -313,18 +355,72 @@ class GeminiClient(BaseLLMClient):
             model=self.model,
             tokens_used=0  # Gemini doesn't return token count in the same way
         )
+    
+    def generate_stream(self, prompt: str, system_prompt: str = "") -> Iterator[str]:
+        client = self._get_client()
+        
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{prompt}"
+        
+        for chunk in client.generate_content(full_prompt, stream=True):
+            if chunk.text:
+                yield chunk.text
+    
+    async def agenerate(self, prompt: str, system_prompt: str = "") -> LLMResponse:
+        client = self._get_client()
+        
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{prompt}"
+        
+        response = await client.generate_content_async(full_prompt)
+        
+        return LLMResponse(
+            content=response.text,
+            model=self.model,
+            tokens_used=0
+        )
+
+
+# Environment variables that decide which client get_llm_client() builds
+_PROVIDER_ENV_VARS = ("GOOGLE_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY", "OLLAMA_HOST")
+
+
+def _env_fingerprint() -> str:
+    """Hash of the provider settings, so rotating a key invalidates cached clients"""
+    joined = "\0".join(os.getenv(name, "") for name in _PROVIDER_ENV_VARS)
+    return hashlib.blake2b(joined.encode(), digest_size=8).hexdigest()
 
 
 def get_llm_client(provider: str = "auto") -> BaseLLMClient:
     """
     Get an LLM client based on provider preference.
     
+    Clients are reused across calls for the same provider and credentials,
+    so SDK setup (and the Ollama probe in auto mode) happens once.
+    
     Args:
         provider: One of "auto", "openai", "anthropic", "ollama", "mock"
         
     Returns:
         An LLM client instance
     """
+    try:
+        return _cached_llm_client(provider, _env_fingerprint())
+    except _NoProviderAvailable:
+        # Not cached: a provider that comes up later (e.g. Ollama started) is picked up
+        print("⚠ No LLM provider available. Using mock mode (limited functionality)")
+        return MockLLMClient()
+
+
+class _NoProviderAvailable(Exception):
+    """Auto mode found no usable provider (raised so lru_cache does not keep the fallback)"""
+
+
+@lru_cache(maxsize=16)
+def _cached_llm_client(provider: str, env_fingerprint: str) -> BaseLLMClient:
+    """Build the client for get_llm_client(); env_fingerprint only feeds the cache key"""
     if provider == "mock":
         return MockLLMClient()
     
@@ -367,8 +463,7 @@ def get_llm_client(provider: str = "auto") -> BaseLLMClient:
                 print(f"✓ Using {name} as LLM provider")
                 return client
         
-        # Fall back to mock if nothing available
-        print("⚠ No LLM provider available. Using mock mode (limited functionality)")
-        return MockLLMClient()
+        # Nothing available: get_llm_client falls back to mock
+        raise _NoProviderAvailable()
     
     raise ValueError(f"Unknown provider: {provider}")
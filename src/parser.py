@@ -2,9 +2,14 @@
 Natural Language Parser - Converts user specifications to structured data
 """
 
+import asyncio
+import copy
 import json
 import re
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict
+from string import Template
+from typing import Dict, Any, List, Optional, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -133,12 +138,19 @@ Rules:
 8. For UART: detect baud rate, parity, data bits from specification
 """
 
+PARSE_PROMPT = Template("Parse this hardware specification:\n\n$user_spec")
+
 
 class SpecParser:
     """Parses natural language specifications into structured data"""
     
+    # Memoize LLM parses of identical spec text (LRU with a TTL)
+    CACHE_MAX_ENTRIES = 128
+    CACHE_TTL_SECONDS = 3600
+    
     def __init__(self, llm_client: Optional[BaseLLMClient] = None):
         self.llm_client = llm_client or get_llm_client("auto")
+        self._parse_cache: "OrderedDict[str, tuple]" = OrderedDict()
     
     def parse(self, user_spec: str) -> ParsedSpec:
         """
@@ -150,17 +162,93 @@ class SpecParser:
         Returns:
             ParsedSpec object with extracted information
         """
-        # Use LLM to parse the specification
-        response = self.llm_client.generate(
-            prompt=f"Parse this hardware specification:\n\n{user_spec}",
+        json_data = self._cached_json(user_spec)
+        if json_data is None:
+            # Use LLM to parse the specification
+            response = self.llm_client.generate(
+                prompt=PARSE_PROMPT.substitute(user_spec=user_spec),
+                system_prompt=SYSTEM_PROMPT
+            )
+            
+            # Extract JSON from response
+            json_data = self._extract_json(response.content)
+            self._store_json(user_spec, json_data)
+        
+        # Convert to ParsedSpec (on a copy, since conversion fills in default features)
+        return self._to_parsed_spec(copy.deepcopy(json_data))
+    
+    async def aparse(self, user_spec: str) -> ParsedSpec:
+        """Async variant of parse(); the LLM call does not block the event loop"""
+        json_data = self._cached_json(user_spec)
+        if json_data is None:
+            response = await self.llm_client.agenerate(
+                prompt=PARSE_PROMPT.substitute(user_spec=user_spec),
+                system_prompt=SYSTEM_PROMPT
+            )
+            json_data = self._extract_json(response.content)
+            self._store_json(user_spec, json_data)
+        
+        return self._to_parsed_spec(copy.deepcopy(json_data))
+    
+    def parse_many(self, user_specs: List[str]) -> List[ParsedSpec]:
+        """
+        Parse several specifications with their LLM calls in flight concurrently.
+        
+        Wall time is roughly that of the slowest call rather than the sum.
+        Results are returned in the same order as user_specs.
+        """
+        async def _gather():
+            return await asyncio.gather(*(self.aparse(spec) for spec in user_specs))
+        
+        return list(asyncio.run(_gather()))
+    
+    def parse_stream(self, user_spec: str) -> Iterator[str]:
+        """
+        Stream the raw LLM output for a specification as it arrives.
+        
+        Intended for UIs (e.g. st.write_stream) that show partial output;
+        pass the joined text to parse_response() to build the ParsedSpec.
+        """
+        json_data = self._cached_json(user_spec)
+        if json_data is not None:
+            yield json.dumps(json_data, indent=2)
+            return
+        
+        yield from self.llm_client.generate_stream(
+            prompt=PARSE_PROMPT.substitute(user_spec=user_spec),
             system_prompt=SYSTEM_PROMPT
         )
+    
+    def parse_response(self, text: str, user_spec: Optional[str] = None) -> ParsedSpec:
+        """
+        Build a ParsedSpec from complete LLM output (e.g. collected from parse_stream).
         
-        # Extract JSON from response
-        json_data = self._extract_json(response.content)
-        
-        # Convert to ParsedSpec
-        return self._to_parsed_spec(json_data)
+        If user_spec is given, the result is cached so a later parse() of the
+        same text skips the LLM call.
+        """
+        json_data = self._extract_json(text)
+        if user_spec is not None:
+            self._store_json(user_spec, json_data)
+        return self._to_parsed_spec(copy.deepcopy(json_data))
+    
+    def _cached_json(self, user_spec: str) -> Optional[Dict[str, Any]]:
+        """Return the cached LLM JSON for this spec text, or None if missing/expired"""
+        entry = self._parse_cache.get(user_spec)
+        if entry is None:
+            return None
+        stored_at, json_data = entry
+        if time.monotonic() - stored_at > self.CACHE_TTL_SECONDS:
+            del self._parse_cache[user_spec]
+            return None
+        self._parse_cache.move_to_end(user_spec)
+        return json_data
+    
+    def _store_json(self, user_spec: str, json_data: Dict[str, Any]) -> None:
+        """Cache the LLM JSON for this spec text, evicting the least recently used entry"""
+        self._parse_cache[user_spec] = (time.monotonic(), json_data)
+        self._parse_cache.move_to_end(user_spec)
+        if len(self._parse_cache) > self.CACHE_MAX_ENTRIES:
+            self._parse_cache.popitem(last=False)
     
     def _extract_json(self, text: str) -> Dict[str, Any]:
         """Extract JSON from LLM response (handles markdown code blocks)"""
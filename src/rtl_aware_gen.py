@@ -61,8 +61,8 @@ class RTLAwareGenerator:
     """
     
     def __init__(self, output_dir: str = "./output"):
+        # Created on demand by save_files; in-memory generation never touches disk
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.rtl_parser = RTLParser()
         self.spec_parser = UnifiedSpecParser()
     
@@ -85,7 +85,20 @@ class RTLAwareGenerator:
         """
         # Parse RTL
         parsed_rtl = self.rtl_parser.parse(rtl_content)
+        return self.generate_from_parsed(parsed_rtl, register_spec, register_spec_file)
+    
+    def generate_from_parsed(
+        self,
+        parsed_rtl: ParsedRTL,
+        register_spec: Optional[str] = None,
+        register_spec_file: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Generate UVM testbench from already-parsed RTL.
         
+        Use this when the caller has parsed the RTL for its own analysis,
+        so the source is not tokenized a second time.
+        """
         # Parse register spec if provided
         parsed_regs = None
         if register_spec:
@@ -10,6 +10,18 @@ from enum import Enum
 from pathlib import Path
 
 
+# ANSI-style port declarations (most common in modern SV):
+# input/output/inout [wire/reg/logic] [signed] [width] name
+ANSI_PORT_RE = re.compile(
+    r'\b(input|output|inout)\s+(wire|reg|logic)?\s*(signed)?\s*(\[\s*(\d+|\w+)\s*:\s*(\d+|\w+)\s*\])?\s*(\w+)',
+    re.IGNORECASE
+)
+
+# Signal label at the start of a waveform diagram row
+# (whitespace excludes newlines so a match never spans two rows)
+WAVEFORM_SIGNAL_RE = re.compile(r'^│[^\S\n]+(\w+)[^\S\n]+', re.MULTILINE)
+
+
 class PortDirection(Enum):
     INPUT = "input"
     OUTPUT = "output"
@@ -106,6 +118,13 @@ class ParsedRTL:
     def inout_ports(self) -> List[Port]:
         return [p for p in self.ports if p.direction == PortDirection.INOUT]
     
+    def ports_by_direction(self) -> Dict[PortDirection, List[Port]]:
+        """Split ports by direction in a single pass over self.ports"""
+        split = {direction: [] for direction in PortDirection}
+        for p in self.ports:
+            split[p.direction].append(p)
+        return split
+    
     def get_data_width(self) -> int:
         """Guess the data bus width from ports"""
         data_patterns = ['data', 'wdata', 'rdata', 'din', 'dout', 'dat']
@@ -265,11 +284,7 @@ class RTLParser:
         """Extract all module ports with their properties"""
         ports = []
         
-        # Pattern for ANSI-style port declarations (most common in modern SV)
-        # input/output/inout [wire/reg/logic] [signed] [width] name
-        ansi_pattern = r'\b(input|output|inout)\s+(wire|reg|logic)?\s*(signed)?\s*(\[\s*(\d+|\w+)\s*:\s*(\d+|\w+)\s*\])?\s*(\w+)'
-        
-        for match in re.finditer(ansi_pattern, self.cleaned_content, re.IGNORECASE):
+        for match in ANSI_PORT_RE.finditer(self.cleaned_content):
             direction_str = match.group(1).lower()
             signal_type_str = match.group(2) or "logic"
             is_signed = match.group(3) is not None
@@ -453,13 +468,14 @@ def analyze_rtl(rtl_content: str, file_path: str = "") -> Dict:
     """
     parser = RTLParser()
     parsed = parser.parse(rtl_content, file_path)
+    by_direction = parsed.ports_by_direction()
     
     return {
         'module_name': parsed.module_name,
         'ports': {
-            'inputs': [{'name': p.name, 'width': p.width, 'signed': p.is_signed} for p in parsed.input_ports],
-            'outputs': [{'name': p.name, 'width': p.width, 'signed': p.is_signed} for p in parsed.output_ports],
-            'inouts': [{'name': p.name, 'width': p.width, 'signed': p.is_signed} for p in parsed.inout_ports],
+            'inputs': [{'name': p.name, 'width': p.width, 'signed': p.is_signed} for p in by_direction[PortDirection.INPUT]],
+            'outputs': [{'name': p.name, 'width': p.width, 'signed': p.is_signed} for p in by_direction[PortDirection.OUTPUT]],
+            'inouts': [{'name': p.name, 'width': p.width, 'signed': p.is_signed} for p in by_direction[PortDirection.INOUT]],
         },
         'parameters': [{'name': p.name, 'value': p.value, 'type': p.param_type} for p in parsed.parameters],
         'clocks': parsed.clocks.clock_signals,
@@ -779,13 +795,8 @@ class WaveformGenerator:
     @staticmethod
     def _extract_signals(ascii_art: str) -> List[str]:
         """Extract signal names from waveform diagram"""
-        import re
-        signals = []
-        for line in ascii_art.split('\n'):
-            match = re.match(r'│\s+(\w+)\s+', line)
-            if match:
-                signals.append(match.group(1))
-        return list(set(signals))
+        # One MULTILINE scan over the diagram instead of splitting it into lines
+        return list({match.group(1) for match in WAVEFORM_SIGNAL_RE.finditer(ascii_art)})
 
 
 class ConstraintGenerator:
@@ -931,8 +942,9 @@ class SimpleParsedRTL:
     def __init__(self, parsed: ParsedRTL):
         self._parsed = parsed
         self.module_name = parsed.module_name
-        self.inputs = [p.name for p in parsed.input_ports]
-        self.outputs = [p.name for p in parsed.output_ports]
+        by_direction = parsed.ports_by_direction()
+        self.inputs = [p.name for p in by_direction[PortDirection.INPUT]]
+        self.outputs = [p.name for p in by_direction[PortDirection.OUTPUT]]
         self.clocks = parsed.clocks.clock_signals
         self.resets = parsed.clocks.reset_signals
         self.fsm = {
@@ -988,8 +1000,8 @@ class SimpleParsedRTL:
         
         return DesignComplexity(
             total_ports=len(parsed.ports),
-            input_count=len(parsed.input_ports),
-            output_count=len(parsed.output_ports),
+            input_count=len(self.inputs),
+            output_count=len(self.outputs),
             data_width=parsed.get_data_width(),
             addr_width=parsed.get_addr_width(),
             fsm_states=fsm_states,
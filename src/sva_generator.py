@@ -73,6 +73,21 @@ class SVAModule:
     reset_active_low: bool = True
     properties: List[SVAProperty] = field(default_factory=list)
     
+    def group_properties(self) -> Tuple[Dict[AssertionType, int], Dict[AssertionCategory, List[SVAProperty]]]:
+        """Count properties per assertion type and group them per category, in one pass"""
+        type_counts: Dict[AssertionType, int] = {}
+        by_category: Dict[AssertionCategory, List[SVAProperty]] = {}
+        for prop in self.properties:
+            type_counts[prop.assertion_type] = type_counts.get(prop.assertion_type, 0) + 1
+            by_category.setdefault(prop.category, []).append(prop)
+        return type_counts, by_category
+    
+    @property
+    def assertion_count(self) -> int:
+        """Number of properties rendered as `assert property` (named properties and direct asserts)"""
+        type_counts, _ = self.group_properties()
+        return type_counts.get(AssertionType.PROPERTY, 0) + type_counts.get(AssertionType.ASSERT, 0)
+    
     def to_sv(self) -> str:
         """Generate complete SVA bind module"""
         reset_condition = f"!{self.reset}" if self.reset_active_low else self.reset
@@ -101,11 +116,7 @@ class SVAModule:
         lines.append(f"")
         
         # Group by category
-        by_category: Dict[AssertionCategory, List[SVAProperty]] = {}
-        for prop in self.properties:
-            if prop.category not in by_category:
-                by_category[prop.category] = []
-            by_category[prop.category].append(prop)
+        _, by_category = self.group_properties()
         
         for category, props in by_category.items():
             lines.append(f"  // {'='*60}")
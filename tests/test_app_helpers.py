@@ -192,6 +192,15 @@ class TestBugPrediction:
         bug_titles = [b['title'] for b in bugs]
         # Should predict APB-specific bugs OR generic bugs at minimum
         assert len(bug_titles) > 0
+        
+        # Passing the complexity directly gives the same predictions
+        assert predict_bugs(parsed, complexity=parsed.complexity) == bugs
+        assert predict_bugs(None, complexity=parsed.complexity)
+        
+        # Records are plain dicts that serialize and can be edited without touching the tables
+        json.dumps(bugs)
+        bugs[0]['title'] = 'changed'
+        assert predict_bugs(parsed)[0]['title'] != 'changed'
     
     def test_spi_bug_prediction(self):
         """Test SPI designs predict clock phase bugs"""
@@ -272,6 +281,25 @@ class TestZIPExport:
             
             assert 'my_dut' in readme
             assert 'UVMForge' in readme
+    
+    def test_zip_into_stream(self):
+        """Test ZIP can be written straight into a caller's stream"""
+        code = "// Test testbench"
+        out = io.BytesIO()
+        
+        assert create_testbench_zip("my_dut", code, None, out=out) is None
+        assert out.getvalue() == create_testbench_zip("my_dut", code, None)
+    
+    def test_zip_is_reproducible(self):
+        """Test identical input gives byte-identical archives"""
+        code = "// Test testbench"
+        first = create_testbench_zip("my_dut", code, None)
+        
+        assert create_testbench_zip("my_dut", code, None) == first
+        with zipfile.ZipFile(io.BytesIO(first), 'r') as zf:
+            assert zf.read('tb/my_dut_tb_pkg.sv').decode('utf-8') == code
+            assert zf.getinfo('tb/my_dut_tb_pkg.sv').compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo('README.md').compress_type == zipfile.ZIP_STORED
 
 
 class TestWaveDromValidJSON:
@@ -464,7 +492,8 @@ from src.app_helpers import (
     parse_uvm_components,
     analyze_testbench_complexity,
     get_signal_explorer_data,
-    generate_enhancement_suggestions
+    generate_enhancement_suggestions,
+    build_gen_context
 )
 
 
@@ -684,3 +713,12 @@ endmodule
         suggestions = generate_enhancement_suggestions(parsed, "// minimal code")
         
         assert len(suggestions) <= 5
+    
+    def test_shared_context_matches_plain_call(self):
+        """Test a prebuilt GenContext gives the same results as raw code"""
+        parsed = parse_rtl("module test(input clk, input rst_n); endmodule")
+        code = "class Driver extends uvm_driver; `uvm_info(\"DRV\", \"go\", UVM_LOW) endclass"
+        ctx = build_gen_context(code)
+        
+        assert generate_enhancement_suggestions(parsed, code, ctx) == generate_enhancement_suggestions(parsed, code)
+        assert calculate_quality_score(parsed, code, ctx) == calculate_quality_score(parsed, code)
@@ -160,6 +160,17 @@ class TestRTLParser:
         assert pready is not None
         assert pready.direction == PortDirection.OUTPUT
     
+    def test_ports_by_direction(self, sample_apb_rtl):
+        """Test single-pass direction split matches the per-direction properties"""
+        parser = RTLParser()
+        result = parser.parse(sample_apb_rtl)
+        
+        by_direction = result.ports_by_direction()
+        
+        assert by_direction[PortDirection.INPUT] == result.input_ports
+        assert by_direction[PortDirection.OUTPUT] == result.output_ports
+        assert by_direction[PortDirection.INOUT] == result.inout_ports
+    
     def test_clock_detection(self, sample_apb_rtl):
         """Test clock signal detection"""
         parser = RTLParser()
@@ -322,6 +333,28 @@ DATA,0x08,VALUE,31:0,RW,0,Data register
         assert mode_field.bit_width == 4
         assert mode_field.msb == 7
         assert mode_field.lsb == 4
+    
+    def test_ipxact_does_not_resolve_external_entities(self, tmp_path):
+        """Test that IP-XACT parsing never expands external entities (XXE)"""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("TOP_SECRET_VALUE")
+        content = f"""<?xml version="1.0"?>
+<!DOCTYPE component [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>
+<component><name>&xxe;</name><version>1.0</version></component>"""
+        
+        try:
+            result = IPXACTParser().parse(content, "evil.xml")
+        except Exception:
+            return  # rejecting the document is just as safe
+        assert "TOP_SECRET_VALUE" not in result.name
+    
+    def test_ipxact_ignores_declared_encoding(self):
+        """Test that IP-XACT text decodes correctly whatever encoding it declares"""
+        content = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<component><name>bl\u00f6ck</name><version>1.0</version></component>"""
+        
+        result = IPXACTParser().parse(content, "latin1.xml")
+        assert result.name == "bl\u00f6ck"
 
 
 class TestRTLAwareGenerator:
@@ -412,6 +445,13 @@ REG1,0x04,DATA,31:0,RW,0,Register 1
         assert "clk" in top_tb
         # Should detect active-low reset
         assert "rst_n" in top_tb
+    
+    def test_generate_from_parsed_matches_rtl(self, sample_rtl):
+        """Test that generating from a pre-parsed RTL gives the same files"""
+        generator = RTLAwareGenerator()
+        parsed = RTLParser().parse(sample_rtl)
+        
+        assert generator.generate_from_parsed(parsed) == generator.generate_from_rtl(sample_rtl)
 
 
 class TestIntegration:
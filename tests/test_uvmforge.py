@@ -777,5 +777,146 @@ class TestAllProtocolsGeneration:
         assert (output_path / f'{protocol}_agent.sv').exists()
 
 
+class TestSpecParserCache:
+    """Tests for memoization of LLM spec parsing in src.parser.SpecParser."""
+    
+    @pytest.fixture
+    def counting_client(self):
+        from src.llm_client import MockLLMClient as RealMockLLMClient
+        
+        class CountingClient(RealMockLLMClient):
+            calls = 0
+            
+            def generate(self, prompt, system_prompt=""):
+                CountingClient.calls += 1
+                return super().generate(prompt, system_prompt)
+        
+        CountingClient.calls = 0
+        return CountingClient()
+    
+    def test_identical_spec_hits_cache(self, counting_client):
+        """Test that the same spec text only calls the LLM once."""
+        from src.parser import SpecParser as LLMSpecParser
+        parser = LLMSpecParser(counting_client)
+        
+        first = parser.parse("APB slave with STATUS register")
+        second = parser.parse("APB slave with STATUS register")
+        
+        assert counting_client.calls == 1
+        assert first == second
+        assert first is not second
+    
+    def test_different_spec_misses_cache(self, counting_client):
+        """Test that a different spec text triggers a new LLM call."""
+        from src.parser import SpecParser as LLMSpecParser
+        parser = LLMSpecParser(counting_client)
+        
+        parser.parse("APB slave")
+        parser.parse("UART 115200 8N1")
+        
+        assert counting_client.calls == 2
+    
+    def test_cache_evicts_least_recently_used(self, counting_client):
+        """Test that the cache is bounded by CACHE_MAX_ENTRIES."""
+        from src.parser import SpecParser as LLMSpecParser
+        parser = LLMSpecParser(counting_client)
+        parser.CACHE_MAX_ENTRIES = 2
+        
+        parser.parse("spec A")
+        parser.parse("spec B")
+        parser.parse("spec C")
+        parser.parse("spec A")
+        
+        assert counting_client.calls == 4
+    
+    def test_parse_stream_then_parse_response(self, counting_client):
+        """Test that streamed output assembles into the same ParsedSpec as parse()."""
+        from src.parser import SpecParser as LLMSpecParser
+        parser = LLMSpecParser(counting_client)
+        spec = "UART 115200 8N1 controller"
+        
+        text = "".join(parser.parse_stream(spec))
+        streamed = parser.parse_response(text, user_spec=spec)
+        
+        assert streamed.protocol == "uart"
+        assert parser.parse(spec) == streamed
+        assert counting_client.calls == 1
+    
+    def test_parse_many_preserves_order(self, counting_client):
+        """Test that concurrent parsing returns specs in input order."""
+        from src.parser import SpecParser as LLMSpecParser
+        parser = LLMSpecParser(counting_client)
+        
+        specs = parser.parse_many(["UART 115200 8N1", "APB slave", "SPI mode 0 master"])
+        
+        assert [s.protocol for s in specs] == ["uart", "apb", "spi"]
+        assert counting_client.calls == 3
+
+
+class TestLLMClientFactory:
+    """Tests for client reuse in src.llm_client.get_llm_client."""
+    
+    def test_auto_mock_fallback_is_not_cached(self, monkeypatch):
+        """Test that auto mode retries providers after falling back to mock."""
+        import src.llm_client as llm
+        llm._cached_llm_client.cache_clear()
+        monkeypatch.setattr(llm, "_env_fingerprint", lambda: "test")
+        for cls in (llm.GeminiClient, llm.OllamaClient, llm.OpenAIClient, llm.AnthropicClient):
+            monkeypatch.setattr(cls, "is_available", lambda self: False)
+        
+        try:
+            assert isinstance(llm.get_llm_client("auto"), llm.MockLLMClient)
+            
+            monkeypatch.setattr(llm.OpenAIClient, "is_available", lambda self: True)
+            client = llm.get_llm_client("auto")
+            assert isinstance(client, llm.OpenAIClient)
+            assert llm.get_llm_client("auto") is client
+        finally:
+            llm._cached_llm_client.cache_clear()
+
+
+class TestUVMGeneratorInMemory:
+    """Tests for src.generator.UVMGenerator rendering without a temp directory."""
+    
+    @pytest.fixture
+    def real_generator(self):
+        from src.generator import UVMGenerator as RealUVMGenerator
+        return RealUVMGenerator()
+    
+    @pytest.fixture
+    def apb_spec(self):
+        from src.parser import SpecParser as LLMSpecParser
+        from src.llm_client import MockLLMClient as RealMockLLMClient
+        return LLMSpecParser(RealMockLLMClient()).parse_quick("APB slave with STATUS at 0x00")
+    
+    def test_generate_in_memory_writes_nothing(self, real_generator, apb_spec, tmp_path, monkeypatch):
+        """Test that in-memory generation renders files without touching disk."""
+        monkeypatch.chdir(tmp_path)
+        files = real_generator.generate_in_memory(apb_spec)
+        
+        assert len(files) >= 10
+        assert files[-1].filename == "Makefile"
+        assert all(f.content for f in files)
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_generate_matches_in_memory(self, real_generator, apb_spec, tmp_path):
+        """Test that generate() writes exactly what generate_in_memory() renders."""
+        in_memory = real_generator.generate_in_memory(apb_spec)
+        written = real_generator.generate(apb_spec, str(tmp_path))
+        
+        assert [f.filename for f in written] == [f.filename for f in in_memory]
+        for f in written:
+            assert (tmp_path / f.filename).read_text() == f.content
+    
+    def test_protocol_templates_compiled_once(self, real_generator, apb_spec):
+        """Test that repeat generations reuse the compiled protocol templates."""
+        first = real_generator.generate_in_memory(apb_spec)
+        compiled = real_generator._compiled["apb"]
+        second = real_generator.generate_in_memory(apb_spec)
+        
+        assert real_generator._compiled["apb"] is compiled
+        assert [f.content for f in first] == [f.content for f in second]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])